@@ -656,9 +656,8 @@ class SupabaseDatabaseManager:
 
     # Additional methods expected by UI components
 
-    @property
-    def db_path(self) -> str:
-        """Return a descriptive path for Supabase connection (for UI display)."""
+    def get_db_info(self) -> str:
+        """Return a description of the Supabase connection (for UI display)."""
         return f"Supabase Database: {self.url}"
 
     def get_next_invoice_number(self) -> str:
@@ -246,30 +246,27 @@ class LabelPrinter:
         Returns:
             Path to generated PDF file
         """
-        import sqlite3
-
-        conn = sqlite3.connect(db_manager.db_path)
-        conn.row_factory = sqlite3.Row
-
-        cursor = conn.execute(
-            """
-            SELECT 
-                c.name as category_name,
-                i.category_item_no,
-                i.net_weight,
-                s.code as supplier_code,
-                i.status
-            FROM inventory i
-            JOIN categories c ON i.category_id = c.id
-            LEFT JOIN suppliers s ON i.supplier_id = s.id
-            WHERE i.category_id = ? AND i.status = 'AVAILABLE'
-            ORDER BY i.category_item_no
-            """,
-            (category_id,),
-        )
+        # Pooled read-only connection owned by the database manager
+        with db_manager.read_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT 
+                    c.name as category_name,
+                    i.category_item_no,
+                    i.net_weight_mg / 1000.0 AS net_weight,
+                    s.code as supplier_code,
+                    i.status
+                FROM inventory i
+                JOIN categories c ON i.category_id = c.id
+                LEFT JOIN suppliers s ON i.supplier_id = s.id
+                WHERE i.category_id = ? AND i.status = 'AVAILABLE'
+                ORDER BY i.category_item_no
+                """,
+                (category_id,),
+            ).fetchall()
 
         items = []
-        for row in cursor.fetchall():
+        for row in rows:
             items.append(
                 {
                     "sr_no": f"{row['category_name']} #{row['category_item_no']}",
@@ -279,8 +276,6 @@ class LabelPrinter:
                 }
             )
 
-        conn.close()
-
         if not items:
             raise ValueError("No items found in this category")
 
@@ -299,29 +294,26 @@ class LabelPrinter:
         Returns:
             Path to generated PDF file
         """
-        import sqlite3
-
-        conn = sqlite3.connect(db_manager.db_path)
-        conn.row_factory = sqlite3.Row
-
-        cursor = conn.execute(
-            """
-            SELECT 
-                c.name as category_name,
-                i.category_item_no,
-                i.net_weight,
-                s.code as supplier_code,
-                i.status
-            FROM inventory i
-            JOIN categories c ON i.category_id = c.id
-            LEFT JOIN suppliers s ON i.supplier_id = s.id
-            WHERE i.status = 'AVAILABLE'
-            ORDER BY c.name, i.category_item_no
-            """
-        )
+        # Pooled read-only connection owned by the database manager
+        with db_manager.read_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT 
+                    c.name as category_name,
+                    i.category_item_no,
+                    i.net_weight_mg / 1000.0 AS net_weight,
+                    s.code as supplier_code,
+                    i.status
+                FROM inventory i
+                JOIN categories c ON i.category_id = c.id
+                LEFT JOIN suppliers s ON i.supplier_id = s.id
+                WHERE i.status = 'AVAILABLE'
+                ORDER BY c.name, i.category_item_no
+                """
+            ).fetchall()
 
         items = []
-        for row in cursor.fetchall():
+        for row in rows:
             items.append(
                 {
                     "sr_no": f"{row['category_name']} #{row['category_item_no']}",
@@ -331,8 +323,6 @@ class LabelPrinter:
                 }
             )
 
-        conn.close()
-
         if not items:
             raise ValueError("No items found in inventory")
 
@@ -352,30 +342,24 @@ class LabelPrinter:
         Returns:
             Path to generated PDF file
         """
-        import sqlite3
-
-        conn = sqlite3.connect(db_manager.db_path)
-        conn.row_factory = sqlite3.Row
-
-        cursor = conn.execute(
-            """
-            SELECT 
-                c.name as category_name,
-                i.category_item_no,
-                i.net_weight,
-                s.code as supplier_code,
-                i.status,
-                i.id
-            FROM inventory i
-            JOIN categories c ON i.category_id = c.id
-            LEFT JOIN suppliers s ON i.supplier_id = s.id
-            WHERE i.id = ?
-            """,
-            (item_id,),
-        )
-
-        row = cursor.fetchone()
-        conn.close()
+        # Pooled read-only connection owned by the database manager
+        with db_manager.read_connection() as conn:
+            row = conn.execute(
+                """
+                SELECT 
+                    c.name as category_name,
+                    i.category_item_no,
+                    i.net_weight_mg / 1000.0 AS net_weight,
+                    s.code as supplier_code,
+                    i.status,
+                    i.id
+                FROM inventory i
+                JOIN categories c ON i.category_id = c.id
+                LEFT JOIN suppliers s ON i.supplier_id = s.id
+                WHERE i.id = ?
+                """,
+                (item_id,),
+            ).fetchone()
 
         if not row:
             raise ValueError(f"Item with ID '{item_id}' not found")
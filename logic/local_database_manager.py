@@ -5,11 +5,490 @@ Provides the same interface as SupabaseDatabaseManager but uses local SQLite
 
 import sqlite3
 import json
-import uuid
+import functools
+import queue
+import threading
+from contextlib import contextmanager
 from datetime import datetime, date
-from decimal import Decimal
-from typing import List, Dict, Optional, Union, Any
+from decimal import Decimal, ROUND_HALF_UP
+from typing import List, Dict, Optional, Union, Any, Iterator
 from pathlib import Path
+from uuid import UUID
+
+# Schema version stored in PRAGMA user_version; databases created before
+# versioning report 0. 3 = weights/money stored as integer milligrams/paise,
+# 4 = trigger-maintained category_stats, 5 = integer ids for bills,
+# bill_items and stock_movements, 6 = updated_at set by UPDATE statements
+# instead of triggers, 7 = bills(status, bill_date) index
+SCHEMA_VERSION = 7
+
+# Idle read-only connections kept open for reuse
+READER_POOL_SIZE = 4
+
+# Largest IN (...) list bound in one statement; older SQLite builds cap
+# bound parameters at 999
+MAX_SQL_PARAMS = 500
+
+# Per-connection page cache (negative = KiB) and memory-mapped I/O window
+CACHE_SIZE_KIB = -65536
+MMAP_SIZE_BYTES = 256 * 1024 * 1024
+
+# Prepared statements kept per connection by sqlite3
+STATEMENT_CACHE_SIZE = 256
+
+# UPDATE/INSERT ... RETURNING needs SQLite 3.35; older builds (e.g. the one
+# shipped with Python 3.8 on Ubuntu 20.04) take a SELECT-based fallback
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Storage units: weights in milligrams, money in paise
+MG_PER_GRAM = 1000
+PAISE_PER_RUPEE = 100
+
+# Hot statements, kept as constants so sqlite3's statement cache reuses them
+_SQL_INSERT_BILL = """
+    INSERT INTO bills (bill_number, customer_name, customer_phone, customer_gstin,
+                       bill_date, subtotal_paise, cgst_rate, sgst_rate, cgst_amount_paise,
+                       sgst_amount_paise, total_amount_paise, rounded_off_paise)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_BILL_ITEM = """
+    INSERT INTO bill_items (bill_id, inventory_id, description,
+                            hsn_code, quantity_mg, rate_paise, amount_paise)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_MOVEMENT = """
+    INSERT INTO stock_movements (inventory_id, movement_type, reference_id,
+                                 reference_type, quantity, notes)
+    VALUES (?, 'SOLD', ?, 'BILL', 1.0, ?)
+"""
+
+# One row per item number in the JSON array; ids come from the column DEFAULT
+_SQL_INSERT_INVENTORY = """
+    INSERT INTO inventory (
+        category_id, category_item_no, description,
+        hsn_code, gross_weight_mg, net_weight_mg, supplier_id, melting_percentage
+    )
+    SELECT ?, value, ?, ?, ?, ?, ?, ? FROM json_each(?)
+    RETURNING id, category_item_no
+"""
+
+# Single-row form for SQLite builds without RETURNING
+_SQL_INSERT_INVENTORY_ROW = """
+    INSERT INTO inventory (
+        category_id, category_item_no, description,
+        hsn_code, gross_weight_mg, net_weight_mg, supplier_id, melting_percentage
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_ADDED_MOVEMENT = """
+    INSERT INTO stock_movements (inventory_id, movement_type, quantity, notes)
+    VALUES (?, 'ADDED', 1.0, 'Initial inventory addition')
+"""
+
+# Active item numbers in a category, read off the unique_category_item_no_active index
+_SQL_ACTIVE_ITEM_NUMBERS = """
+    SELECT COUNT(*), IFNULL(MAX(category_item_no), 0)
+    FROM inventory
+    WHERE category_id = ? AND status IN ('AVAILABLE', 'RESERVED')
+"""
+
+# Lowest free category_item_no slots, for categories with gaps to reuse
+_SQL_FREE_ITEM_NUMBERS = """
+    SELECT n FROM (
+        WITH RECURSIVE nums(n) AS (
+            SELECT 1
+            UNION ALL
+            SELECT n + 1 FROM nums WHERE n < 10000
+        )
+        SELECT nums.n
+        FROM nums
+        LEFT JOIN inventory i
+        ON i.category_id = ? AND i.category_item_no = nums.n
+        AND i.status IN ('AVAILABLE', 'RESERVED')
+        WHERE i.category_item_no IS NULL
+        LIMIT ?
+    )
+"""
+
+# Low stock reads the trigger-maintained category_stats, so the threshold
+# filter touches one row per category rather than the inventory history
+_SQL_LOW_STOCK = """
+    SELECT
+        c.id as id,
+        c.name as name,
+        c.name as category_name,
+        s.available_count as quantity,
+        s.available_count as available_quantity,
+        0.0 as unit_price,
+        s.available_gross_weight_mg / 1000.0 as available_gross_weight,
+        s.available_net_weight_mg / 1000.0 as available_net_weight,
+        s.total_count as total_items,
+        s.sold_count as sold_items
+    FROM categories c
+    JOIN category_stats s ON s.category_id = c.id
+    WHERE s.available_count <= ?
+    ORDER BY c.name
+"""
+
+# Full schema, applied only when PRAGMA user_version is behind SCHEMA_VERSION
+SCHEMA_SQL = """
+    -- Categories table
+    CREATE TABLE IF NOT EXISTS categories (
+        id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+        name TEXT UNIQUE NOT NULL,
+        description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Suppliers table
+    CREATE TABLE IF NOT EXISTS suppliers (
+        id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+        name TEXT NOT NULL,
+        code TEXT UNIQUE NOT NULL,
+        contact_person TEXT,
+        phone TEXT,
+        email TEXT,
+        address TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Inventory table (removed product_name, using category as name)
+    CREATE TABLE IF NOT EXISTS inventory (
+        id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+        category_id TEXT NOT NULL REFERENCES categories(id),
+        category_item_no INTEGER NOT NULL,
+        description TEXT,
+        hsn_code TEXT,
+        gross_weight_mg INTEGER NOT NULL CHECK (gross_weight_mg > 0),
+        net_weight_mg INTEGER NOT NULL CHECK (net_weight_mg > 0 AND net_weight_mg <= gross_weight_mg),
+        supplier_id TEXT REFERENCES suppliers(id),
+        melting_percentage DECIMAL(5,2) DEFAULT 0.00,
+        status TEXT NOT NULL DEFAULT 'AVAILABLE' CHECK (status IN ('AVAILABLE', 'SOLD', 'RESERVED')),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- HSN code history table
+    CREATE TABLE IF NOT EXISTS hsn_code_history (
+        id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+        hsn_code TEXT UNIQUE NOT NULL,
+        description TEXT,
+        last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Customers table
+    CREATE TABLE IF NOT EXISTS customers (
+        id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+        name TEXT NOT NULL,
+        phone TEXT,
+        email TEXT,
+        address TEXT,
+        gstin TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Bills table
+    CREATE TABLE IF NOT EXISTS bills (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        bill_number TEXT UNIQUE NOT NULL,
+        customer_id TEXT REFERENCES customers(id),
+        customer_name TEXT NOT NULL,
+        customer_phone TEXT,
+        customer_gstin TEXT,
+        bill_date DATE NOT NULL DEFAULT (date('now')),
+        subtotal_paise INTEGER NOT NULL DEFAULT 0,
+        cgst_rate DECIMAL(5,2) NOT NULL DEFAULT 1.50,
+        sgst_rate DECIMAL(5,2) NOT NULL DEFAULT 1.50,
+        cgst_amount_paise INTEGER NOT NULL DEFAULT 0,
+        sgst_amount_paise INTEGER NOT NULL DEFAULT 0,
+        total_amount_paise INTEGER NOT NULL DEFAULT 0,
+        rounded_off_paise INTEGER NOT NULL DEFAULT 0,
+        status TEXT NOT NULL DEFAULT 'GENERATED' CHECK (status IN ('GENERATED', 'REVERSED')),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Bill items table (removed product_name field)
+    CREATE TABLE IF NOT EXISTS bill_items (
+        id INTEGER PRIMARY KEY,
+        bill_id INTEGER NOT NULL REFERENCES bills(id) ON DELETE CASCADE,
+        inventory_id TEXT REFERENCES inventory(id),
+        description TEXT NOT NULL,
+        hsn_code TEXT,
+        quantity_mg INTEGER NOT NULL DEFAULT 1000,
+        rate_paise INTEGER NOT NULL,
+        amount_paise INTEGER NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Stock movements table
+    CREATE TABLE IF NOT EXISTS stock_movements (
+        id INTEGER PRIMARY KEY,
+        inventory_id TEXT REFERENCES inventory(id),
+        movement_type TEXT NOT NULL CHECK (movement_type IN ('ADDED', 'SOLD', 'REVERSED', 'ADJUSTED')),
+        reference_id TEXT,
+        reference_type TEXT,
+        quantity DECIMAL(10,3) NOT NULL DEFAULT 1.000,
+        notes TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Per-category inventory aggregates, kept current by the triggers below
+    CREATE TABLE IF NOT EXISTS category_stats (
+        category_id TEXT PRIMARY KEY REFERENCES categories(id) ON DELETE CASCADE,
+        available_count INTEGER NOT NULL DEFAULT 0,
+        sold_count INTEGER NOT NULL DEFAULT 0,
+        reserved_count INTEGER NOT NULL DEFAULT 0,
+        total_count INTEGER NOT NULL DEFAULT 0,
+        available_gross_weight_mg INTEGER NOT NULL DEFAULT 0,
+        available_net_weight_mg INTEGER NOT NULL DEFAULT 0,
+        total_gross_weight_mg INTEGER NOT NULL DEFAULT 0,
+        total_net_weight_mg INTEGER NOT NULL DEFAULT 0
+    );
+
+    -- Indexes for performance
+    -- Covering index for per-category aggregates (supersedes idx_inventory_category_status)
+    DROP INDEX IF EXISTS idx_inventory_category_status;
+    CREATE INDEX IF NOT EXISTS idx_inventory_category_status_weights
+        ON inventory(category_id, status, gross_weight_mg, net_weight_mg);
+    CREATE INDEX IF NOT EXISTS idx_inventory_status ON inventory(status);
+    -- Partial index over sellable stock only (stays small as SOLD rows pile up)
+    CREATE INDEX IF NOT EXISTS idx_inventory_available
+        ON inventory(category_id, category_item_no, gross_weight_mg, net_weight_mg)
+        WHERE status = 'AVAILABLE';
+    CREATE INDEX IF NOT EXISTS idx_bill_items_bill_id ON bill_items(bill_id);
+    CREATE INDEX IF NOT EXISTS idx_bill_items_inventory_id ON bill_items(inventory_id);
+    CREATE INDEX IF NOT EXISTS idx_stock_movements_inventory_id ON stock_movements(inventory_id);
+    CREATE INDEX IF NOT EXISTS idx_bills_created_at ON bills(created_at);
+    CREATE INDEX IF NOT EXISTS idx_bills_status_date ON bills(status, bill_date);
+
+    -- ✅ Conditional unique constraint (only for active items)
+    CREATE UNIQUE INDEX IF NOT EXISTS unique_category_item_no_active 
+    ON inventory (category_id, category_item_no)
+    WHERE status IN ('AVAILABLE', 'RESERVED');
+
+    -- updated_at is set by each UPDATE statement; drop the old per-row triggers
+    DROP TRIGGER IF EXISTS update_categories_updated_at;
+    DROP TRIGGER IF EXISTS update_suppliers_updated_at;
+    DROP TRIGGER IF EXISTS update_inventory_updated_at;
+    DROP TRIGGER IF EXISTS update_customers_updated_at;
+    DROP TRIGGER IF EXISTS update_bills_updated_at;
+
+    -- Triggers maintaining category_stats
+    CREATE TRIGGER IF NOT EXISTS category_stats_category_insert
+        AFTER INSERT ON categories FOR EACH ROW
+        BEGIN
+            INSERT OR IGNORE INTO category_stats (category_id) VALUES (NEW.id);
+        END;
+
+    CREATE TRIGGER IF NOT EXISTS category_stats_category_delete
+        AFTER DELETE ON categories FOR EACH ROW
+        BEGIN
+            DELETE FROM category_stats WHERE category_id = OLD.id;
+        END;
+
+    CREATE TRIGGER IF NOT EXISTS category_stats_inventory_insert
+        AFTER INSERT ON inventory FOR EACH ROW
+        BEGIN
+            UPDATE category_stats SET
+                available_count = available_count + (NEW.status = 'AVAILABLE'),
+                sold_count = sold_count + (NEW.status = 'SOLD'),
+                reserved_count = reserved_count + (NEW.status = 'RESERVED'),
+                total_count = total_count + 1,
+                available_gross_weight_mg = available_gross_weight_mg + NEW.gross_weight_mg * (NEW.status = 'AVAILABLE'),
+                available_net_weight_mg = available_net_weight_mg + NEW.net_weight_mg * (NEW.status = 'AVAILABLE'),
+                total_gross_weight_mg = total_gross_weight_mg + NEW.gross_weight_mg,
+                total_net_weight_mg = total_net_weight_mg + NEW.net_weight_mg
+            WHERE category_id = NEW.category_id;
+        END;
+
+    CREATE TRIGGER IF NOT EXISTS category_stats_inventory_delete
+        AFTER DELETE ON inventory FOR EACH ROW
+        BEGIN
+            UPDATE category_stats SET
+                available_count = available_count - (OLD.status = 'AVAILABLE'),
+                sold_count = sold_count - (OLD.status = 'SOLD'),
+                reserved_count = reserved_count - (OLD.status = 'RESERVED'),
+                total_count = total_count - 1,
+                available_gross_weight_mg = available_gross_weight_mg - OLD.gross_weight_mg * (OLD.status = 'AVAILABLE'),
+                available_net_weight_mg = available_net_weight_mg - OLD.net_weight_mg * (OLD.status = 'AVAILABLE'),
+                total_gross_weight_mg = total_gross_weight_mg - OLD.gross_weight_mg,
+                total_net_weight_mg = total_net_weight_mg - OLD.net_weight_mg
+            WHERE category_id = OLD.category_id;
+        END;
+
+    CREATE TRIGGER IF NOT EXISTS category_stats_inventory_update
+        AFTER UPDATE OF category_id, status, gross_weight_mg, net_weight_mg ON inventory
+        FOR EACH ROW
+        BEGIN
+            UPDATE category_stats SET
+                available_count = available_count - (OLD.status = 'AVAILABLE'),
+                sold_count = sold_count - (OLD.status = 'SOLD'),
+                reserved_count = reserved_count - (OLD.status = 'RESERVED'),
+                total_count = total_count - 1,
+                available_gross_weight_mg = available_gross_weight_mg - OLD.gross_weight_mg * (OLD.status = 'AVAILABLE'),
+                available_net_weight_mg = available_net_weight_mg - OLD.net_weight_mg * (OLD.status = 'AVAILABLE'),
+                total_gross_weight_mg = total_gross_weight_mg - OLD.gross_weight_mg,
+                total_net_weight_mg = total_net_weight_mg - OLD.net_weight_mg
+            WHERE category_id = OLD.category_id;
+            UPDATE category_stats SET
+                available_count = available_count + (NEW.status = 'AVAILABLE'),
+                sold_count = sold_count + (NEW.status = 'SOLD'),
+                reserved_count = reserved_count + (NEW.status = 'RESERVED'),
+                total_count = total_count + 1,
+                available_gross_weight_mg = available_gross_weight_mg + NEW.gross_weight_mg * (NEW.status = 'AVAILABLE'),
+                available_net_weight_mg = available_net_weight_mg + NEW.net_weight_mg * (NEW.status = 'AVAILABLE'),
+                total_gross_weight_mg = total_gross_weight_mg + NEW.gross_weight_mg,
+                total_net_weight_mg = total_net_weight_mg + NEW.net_weight_mg
+            WHERE category_id = NEW.category_id;
+        END;
+"""
+
+# Bind Decimal rates/percentages and UUID ids directly; str keeps the
+# dashed uuid form used by existing rows
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_adapter(UUID, str)
+
+
+def _to_mg(grams) -> int:
+    """Convert a weight in grams to integer milligrams."""
+    value = Decimal(str(grams or 0)) * MG_PER_GRAM
+    return int(value.quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def _to_paise(rupees) -> int:
+    """Convert an amount in rupees to integer paise."""
+    value = Decimal(str(rupees or 0)) * PAISE_PER_RUPEE
+    return int(value.quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def _insert_returning_id(conn, table: str, sql: str, params) -> str:
+    """Run a single-row INSERT into table and return the new row's id."""
+    if _SQLITE_HAS_RETURNING:
+        return conn.execute(f"{sql} RETURNING id", params).fetchone()[0]
+    # Without RETURNING, read the DEFAULT-generated id back by rowid
+    rowid = conn.execute(sql, params).lastrowid
+    return conn.execute(f"SELECT id FROM {table} WHERE rowid = ?", (rowid,)).fetchone()[0]
+
+
+def _iter_dicts(cursor, batch_size: int = 256):
+    """Yield cursor rows as dicts, fetching in batches.
+
+    Column names are read once from cursor.description rather than per row.
+    """
+    columns = [col[0] for col in cursor.description]
+    # Plain tuples are cheaper to fetch than sqlite3.Row objects
+    cursor.row_factory = None
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield dict(zip(columns, row))
+    finally:
+        # Release the statement even if the caller stops early
+        cursor.close()
+
+
+def _iter_decoded(cursor, batch_size: int = 256):
+    """Like _iter_dicts, mapping *_mg/*_paise columns back to grams/rupees."""
+    columns = []
+    for col in cursor.description:
+        name = col[0]
+        if name.endswith("_mg"):
+            columns.append((name[:-3], MG_PER_GRAM))
+        elif name.endswith("_paise"):
+            columns.append((name[:-6], PAISE_PER_RUPEE))
+        else:
+            columns.append((name, None))
+
+    # Plain tuples are cheaper to fetch than sqlite3.Row objects
+    cursor.row_factory = None
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield {
+                    name: value / scale if scale and value is not None else value
+                    for (name, scale), value in zip(columns, row)
+                }
+    finally:
+        # Release the statement even if the caller stops early
+        cursor.close()
+
+
+def _copy_result(value):
+    """Shallow-copy a cached list of dicts (or dict) so callers can't mutate the cache."""
+    if isinstance(value, list):
+        return [dict(item) if isinstance(item, dict) else item for item in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def _cached_read(method):
+    """Cache a read-only method until the database changes.
+
+    Entries are keyed on the connection's data version, so any write makes
+    earlier results unreachable.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method, args, tuple(sorted(kwargs.items())), self._data_version())
+        return _copy_result(self._read_cache(key))
+
+    return wrapper
+
+
+def _serialized_write(method):
+    """Run a mutating method while holding the writer lock.
+
+    Writes are serialized onto the single writer connection; readers use their
+    own pooled connections and are never blocked by the lock.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._write_lock:
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._write_generation += 1
+
+    return wrapper
+
+
+def _product_from_row(row) -> Dict:
+    """Build a product dict from a get_products row (fixed column order)."""
+    return {
+        "id": row[0],
+        "name": row[11],  # Use category name as product name
+        "description": row[3] or "",
+        "category_id": row[1],
+        "category_name": row[11],
+        "category_item_id": row[2],
+        "hsn_code": row[4] or "",
+        "gross_weight": row[5] / MG_PER_GRAM,
+        "net_weight": row[6] / MG_PER_GRAM,
+        "quantity": 1,
+        "unit_price": 0.0,  # Default value for UI compatibility
+        "supplier_id": row[7],
+        "supplier_name": row[12] or "",
+        "supplier_code": row[13] or "",
+        "melting_percentage": float(row[8] or 0),
+        "status": row[9],
+        "created_at": row[10],
+    }
 
 
 class LocalDatabaseManager:
@@ -18,12 +497,96 @@ class LocalDatabaseManager:
     def __init__(self, db_path: str = "jewelry_management.db"):
         """Initialize SQLite database."""
         self.db_path = db_path
+        self._conn = self._connect()
+        self._write_lock = threading.RLock()
+        self._write_generation = 0
+        self._readers = queue.LifoQueue(maxsize=READER_POOL_SIZE)
+        self._version_conn = None
+        self._version_lock = threading.Lock()
+        self._read_cache = functools.lru_cache(maxsize=128)(self._call_uncached)
         self.init_database()
 
+    def _call_uncached(self, key):
+        """Run the wrapped read method for a _cached_read cache key."""
+        method, args, kwargs, _version = key
+        return method(self, *args, **dict(kwargs))
+
+    def _data_version(self) -> tuple:
+        """Return a token that changes whenever the database contents change.
+
+        The write generation is bumped when a write method finishes, and
+        PRAGMA data_version changes when any other connection commits, which
+        covers the writer (including writes made directly through
+        get_connection()) and other processes. The pragma's value is per
+        connection, so it is always read on one dedicated read-only connection;
+        that keeps cached reads from queueing behind the write lock.
+        """
+        with self._version_lock:
+            if self._version_conn is None:
+                self._version_conn = self._connect_reader()
+            return (
+                self._write_generation,
+                self._version_conn.execute("PRAGMA data_version").fetchone()[0],
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the long-lived connection shared by all methods."""
+        # Implicit transactions use BEGIN IMMEDIATE so writers never hit SQLITE_BUSY
+        # when upgrading a read lock mid-transaction
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level="IMMEDIATE",
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA busy_timeout = 5000")
+        conn.execute(f"PRAGMA cache_size = {CACHE_SIZE_KIB}")
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE_BYTES}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def _connect_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection for the reader pool."""
+        conn = sqlite3.connect(
+            f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout = 5000")
+        conn.execute(f"PRAGMA cache_size = {CACHE_SIZE_KIB}")
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE_BYTES}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+
+    @contextmanager
+    def _read(self):
+        """Borrow a read-only connection from the pool."""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._connect_reader()
+        try:
+            yield conn
+        finally:
+            try:
+                self._readers.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
     def _migrate_if_needed(self):
         """Check if database migration is needed and perform migrations."""
+        # Separate connection: table rebuilds need foreign keys off. Every step
+        # runs in one transaction, so a failure leaves the database untouched
+        # and the migration is retried on the next start
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
+        cursor.execute("BEGIN")
 
         # Check if product_name column exists in inventory table
         cursor.execute("PRAGMA table_info(inventory)")
@@ -72,7 +635,7 @@ class LocalDatabaseManager:
                 print(f"⚠️ Migration failed: {e}")
                 conn.rollback()
                 conn.close()
-                return
+                raise
 
         # Check if product_name column exists in bill_items table
         cursor.execute("PRAGMA table_info(bill_items)")
@@ -117,293 +680,487 @@ class LocalDatabaseManager:
                 print(f"⚠️ Bill items migration failed: {e}")
                 conn.rollback()
                 conn.close()
-                return
+                raise
+
+        # Convert DECIMAL weight/money columns to integer milligrams/paise
+        cursor.execute("PRAGMA user_version")
+        version = cursor.fetchone()[0]
+        cursor.execute("PRAGMA table_info(inventory)")
+        columns = [col[1] for col in cursor.fetchall()]
+
+        if version < 3 and "gross_weight" in columns:
+            print("🔄 Migrating database: Storing weights and amounts as integers...")
+            try:
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS inventory_new (
+                        id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+                        category_id TEXT NOT NULL REFERENCES categories(id),
+                        category_item_no INTEGER NOT NULL,
+                        description TEXT,
+                        hsn_code TEXT,
+                        gross_weight_mg INTEGER NOT NULL CHECK (gross_weight_mg > 0),
+                        net_weight_mg INTEGER NOT NULL CHECK (net_weight_mg > 0 AND net_weight_mg <= gross_weight_mg),
+                        supplier_id TEXT REFERENCES suppliers(id),
+                        melting_percentage DECIMAL(5,2) DEFAULT 0.00,
+                        status TEXT NOT NULL DEFAULT 'AVAILABLE' CHECK (status IN ('AVAILABLE', 'SOLD', 'RESERVED')),
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """
+                )
+                cursor.execute(
+                    """
+                    INSERT INTO inventory_new
+                    SELECT id, category_id, category_item_no, description, hsn_code,
+                           CAST(ROUND(gross_weight * 1000) AS INTEGER),
+                           CAST(ROUND(net_weight * 1000) AS INTEGER),
+                           supplier_id, melting_percentage, status, created_at, updated_at
+                    FROM inventory
+                """
+                )
+                cursor.execute("DROP TABLE inventory")
+                cursor.execute("ALTER TABLE inventory_new RENAME TO inventory")
+
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS bills_new (
+                        id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+                        bill_number TEXT UNIQUE NOT NULL,
+                        customer_id TEXT REFERENCES customers(id),
+                        customer_name TEXT NOT NULL,
+                        customer_phone TEXT,
+                        customer_gstin TEXT,
+                        bill_date DATE NOT NULL DEFAULT (date('now')),
+                        subtotal_paise INTEGER NOT NULL DEFAULT 0,
+                        cgst_rate DECIMAL(5,2) NOT NULL DEFAULT 1.50,
+                        sgst_rate DECIMAL(5,2) NOT NULL DEFAULT 1.50,
+                        cgst_amount_paise INTEGER NOT NULL DEFAULT 0,
+                        sgst_amount_paise INTEGER NOT NULL DEFAULT 0,
+                        total_amount_paise INTEGER NOT NULL DEFAULT 0,
+                        rounded_off_paise INTEGER NOT NULL DEFAULT 0,
+                        status TEXT NOT NULL DEFAULT 'GENERATED' CHECK (status IN ('GENERATED', 'REVERSED')),
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """
+                )
+                cursor.execute(
+                    """
+                    INSERT INTO bills_new
+                    SELECT id, bill_number, customer_id, customer_name, customer_phone,
+                           customer_gstin, bill_date,
+                           CAST(ROUND(subtotal * 100) AS INTEGER),
+                           cgst_rate, sgst_rate,
+                           CAST(ROUND(cgst_amount * 100) AS INTEGER),
+                           CAST(ROUND(sgst_amount * 100) AS INTEGER),
+                           CAST(ROUND(total_amount * 100) AS INTEGER),
+                           CAST(ROUND(rounded_off * 100) AS INTEGER),
+                           status, created_at, updated_at
+                    FROM bills
+                """
+                )
+                cursor.execute("DROP TABLE bills")
+                cursor.execute("ALTER TABLE bills_new RENAME TO bills")
+
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS bill_items_new (
+                        id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+                        bill_id TEXT NOT NULL REFERENCES bills(id) ON DELETE CASCADE,
+                        inventory_id TEXT REFERENCES inventory(id),
+                        description TEXT NOT NULL,
+                        hsn_code TEXT,
+                        quantity_mg INTEGER NOT NULL DEFAULT 1000,
+                        rate_paise INTEGER NOT NULL,
+                        amount_paise INTEGER NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """
+                )
+                cursor.execute(
+                    """
+                    INSERT INTO bill_items_new
+                    SELECT id, bill_id, inventory_id, description, hsn_code,
+                           CAST(ROUND(quantity * 1000) AS INTEGER),
+                           CAST(ROUND(rate * 100) AS INTEGER),
+                           CAST(ROUND(amount * 100) AS INTEGER),
+                           created_at
+                    FROM bill_items
+                """
+                )
+                cursor.execute("DROP TABLE bill_items")
+                cursor.execute("ALTER TABLE bill_items_new RENAME TO bill_items")
+
+                print("✅ Integer units migration completed")
+            except Exception as e:
+                print(f"⚠️ Integer units migration failed: {e}")
+                conn.rollback()
+                conn.close()
+                raise
+
+        # Check if bills still use text UUID primary keys
+        cursor.execute("PRAGMA table_info(bills)")
+        bill_id_types = [col[2] for col in cursor.fetchall() if col[1] == "id"]
+
+        if bill_id_types and bill_id_types[0].upper() == "TEXT":
+            print("🔄 Migrating database: Using integer ids for bills...")
+            try:
+                # Number existing bills in creation order
+                cursor.execute(
+                    """
+                    CREATE TEMP TABLE bill_id_map AS
+                    SELECT id AS old_id,
+                           ROW_NUMBER() OVER (ORDER BY created_at, rowid) AS new_id
+                    FROM bills
+                """
+                )
+
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS bills_new (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        bill_number TEXT UNIQUE NOT NULL,
+                        customer_id TEXT REFERENCES customers(id),
+                        customer_name TEXT NOT NULL,
+                        customer_phone TEXT,
+                        customer_gstin TEXT,
+                        bill_date DATE NOT NULL DEFAULT (date('now')),
+                        subtotal_paise INTEGER NOT NULL DEFAULT 0,
+                        cgst_rate DECIMAL(5,2) NOT NULL DEFAULT 1.50,
+                        sgst_rate DECIMAL(5,2) NOT NULL DEFAULT 1.50,
+                        cgst_amount_paise INTEGER NOT NULL DEFAULT 0,
+                        sgst_amount_paise INTEGER NOT NULL DEFAULT 0,
+                        total_amount_paise INTEGER NOT NULL DEFAULT 0,
+                        rounded_off_paise INTEGER NOT NULL DEFAULT 0,
+                        status TEXT NOT NULL DEFAULT 'GENERATED' CHECK (status IN ('GENERATED', 'REVERSED')),
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """
+                )
+                cursor.execute(
+                    """
+                    INSERT INTO bills_new
+                    SELECT m.new_id, b.bill_number, b.customer_id, b.customer_name,
+                           b.customer_phone, b.customer_gstin, b.bill_date,
+                           b.subtotal_paise, b.cgst_rate, b.sgst_rate,
+                           b.cgst_amount_paise, b.sgst_amount_paise,
+                           b.total_amount_paise, b.rounded_off_paise,
+                           b.status, b.created_at, b.updated_at
+                    FROM bills b
+                    JOIN bill_id_map m ON m.old_id = b.id
+                    ORDER BY m.new_id
+                """
+                )
+                cursor.execute("DROP TABLE bills")
+                cursor.execute("ALTER TABLE bills_new RENAME TO bills")
+
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS bill_items_new (
+                        id INTEGER PRIMARY KEY,
+                        bill_id INTEGER NOT NULL REFERENCES bills(id) ON DELETE CASCADE,
+                        inventory_id TEXT REFERENCES inventory(id),
+                        description TEXT NOT NULL,
+                        hsn_code TEXT,
+                        quantity_mg INTEGER NOT NULL DEFAULT 1000,
+                        rate_paise INTEGER NOT NULL,
+                        amount_paise INTEGER NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """
+                )
+                cursor.execute(
+                    """
+                    INSERT INTO bill_items_new (bill_id, inventory_id, description, hsn_code,
+                                                quantity_mg, rate_paise, amount_paise, created_at)
+                    SELECT m.new_id, bi.inventory_id, bi.description, bi.hsn_code,
+                           bi.quantity_mg, bi.rate_paise, bi.amount_paise, bi.created_at
+                    FROM bill_items bi
+                    JOIN bill_id_map m ON m.old_id = bi.bill_id
+                    ORDER BY bi.rowid
+                """
+                )
+                cursor.execute("DROP TABLE bill_items")
+                cursor.execute("ALTER TABLE bill_items_new RENAME TO bill_items")
+
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS stock_movements_new (
+                        id INTEGER PRIMARY KEY,
+                        inventory_id TEXT REFERENCES inventory(id),
+                        movement_type TEXT NOT NULL CHECK (movement_type IN ('ADDED', 'SOLD', 'REVERSED', 'ADJUSTED')),
+                        reference_id TEXT,
+                        reference_type TEXT,
+                        quantity DECIMAL(10,3) NOT NULL DEFAULT 1.000,
+                        notes TEXT,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """
+                )
+                cursor.execute(
+                    """
+                    INSERT INTO stock_movements_new (inventory_id, movement_type, reference_id,
+                                                     reference_type, quantity, notes, created_at)
+                    SELECT sm.inventory_id, sm.movement_type,
+                           COALESCE(m.new_id, sm.reference_id),
+                           sm.reference_type, sm.quantity, sm.notes, sm.created_at
+                    FROM stock_movements sm
+                    LEFT JOIN bill_id_map m
+                        ON sm.reference_type = 'BILL' AND m.old_id = sm.reference_id
+                    ORDER BY sm.rowid
+                """
+                )
+                cursor.execute("DROP TABLE stock_movements")
+                cursor.execute("ALTER TABLE stock_movements_new RENAME TO stock_movements")
+                cursor.execute("DROP TABLE bill_id_map")
+
+                print("✅ Integer ids migration completed")
+            except Exception as e:
+                print(f"⚠️ Integer ids migration failed: {e}")
+                conn.rollback()
+                conn.close()
+                raise
 
         conn.commit()
         conn.close()
 
+    @_serialized_write
     def init_database(self):
         """Initialize SQLite database with complete schema (includes slot reuse)."""
-        # First, check if we need to migrate existing database
+        conn = self._conn
+
+        # An up-to-date database needs neither migrations nor the schema pass
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == SCHEMA_VERSION:
+            return
+
+        # First, check if we need to migrate existing database; a failed
+        # migration raises, so user_version is only stamped below once every
+        # step has succeeded
         self._migrate_if_needed()
 
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON")
+        # Sample data is only seeded when the schema is created for the first time
+        is_new_database = not conn.execute("PRAGMA table_info(categories)").fetchall()
 
-        schema_sql = """
-        -- Categories table
-        CREATE TABLE IF NOT EXISTS categories (
-            id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
-            name TEXT UNIQUE NOT NULL,
-            description TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        -- Suppliers table
-        CREATE TABLE IF NOT EXISTS suppliers (
-            id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
-            name TEXT NOT NULL,
-            code TEXT UNIQUE NOT NULL,
-            contact_person TEXT,
-            phone TEXT,
-            email TEXT,
-            address TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        -- Inventory table (removed product_name, using category as name)
-        CREATE TABLE IF NOT EXISTS inventory (
-            id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
-            category_id TEXT NOT NULL REFERENCES categories(id),
-            category_item_no INTEGER NOT NULL,
-            description TEXT,
-            hsn_code TEXT,
-            gross_weight DECIMAL(10,3) NOT NULL CHECK (gross_weight > 0),
-            net_weight DECIMAL(10,3) NOT NULL CHECK (net_weight > 0 AND net_weight <= gross_weight),
-            supplier_id TEXT REFERENCES suppliers(id),
-            melting_percentage DECIMAL(5,2) DEFAULT 0.00,
-            status TEXT NOT NULL DEFAULT 'AVAILABLE' CHECK (status IN ('AVAILABLE', 'SOLD', 'RESERVED')),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        -- HSN code history table
-        CREATE TABLE IF NOT EXISTS hsn_code_history (
-            id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
-            hsn_code TEXT UNIQUE NOT NULL,
-            description TEXT,
-            last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        -- Customers table
-        CREATE TABLE IF NOT EXISTS customers (
-            id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
-            name TEXT NOT NULL,
-            phone TEXT,
-            email TEXT,
-            address TEXT,
-            gstin TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        -- Bills table
-        CREATE TABLE IF NOT EXISTS bills (
-            id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
-            bill_number TEXT UNIQUE NOT NULL,
-            customer_id TEXT REFERENCES customers(id),
-            customer_name TEXT NOT NULL,
-            customer_phone TEXT,
-            customer_gstin TEXT,
-            bill_date DATE NOT NULL DEFAULT (date('now')),
-            subtotal DECIMAL(12,2) NOT NULL DEFAULT 0.00,
-            cgst_rate DECIMAL(5,2) NOT NULL DEFAULT 1.50,
-            sgst_rate DECIMAL(5,2) NOT NULL DEFAULT 1.50,
-            cgst_amount DECIMAL(12,2) NOT NULL DEFAULT 0.00,
-            sgst_amount DECIMAL(12,2) NOT NULL DEFAULT 0.00,
-            total_amount DECIMAL(12,2) NOT NULL DEFAULT 0.00,
-            rounded_off DECIMAL(12,2) NOT NULL DEFAULT 0.00,
-            status TEXT NOT NULL DEFAULT 'GENERATED' CHECK (status IN ('GENERATED', 'REVERSED')),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        -- Bill items table (removed product_name field)
-        CREATE TABLE IF NOT EXISTS bill_items (
-            id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
-            bill_id TEXT NOT NULL REFERENCES bills(id) ON DELETE CASCADE,
-            inventory_id TEXT REFERENCES inventory(id),
-            description TEXT NOT NULL,
-            hsn_code TEXT,
-            quantity DECIMAL(10,3) NOT NULL DEFAULT 1.000,
-            rate DECIMAL(12,2) NOT NULL,
-            amount DECIMAL(12,2) NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        -- Stock movements table
-        CREATE TABLE IF NOT EXISTS stock_movements (
-            id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
-            inventory_id TEXT REFERENCES inventory(id),
-            movement_type TEXT NOT NULL CHECK (movement_type IN ('ADDED', 'SOLD', 'REVERSED', 'ADJUSTED')),
-            reference_id TEXT,
-            reference_type TEXT,
-            quantity DECIMAL(10,3) NOT NULL DEFAULT 1.000,
-            notes TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        -- Indexes for performance
-        CREATE INDEX IF NOT EXISTS idx_inventory_category_status ON inventory(category_id, status);
-        CREATE INDEX IF NOT EXISTS idx_inventory_status ON inventory(status);
-        CREATE INDEX IF NOT EXISTS idx_bill_items_bill_id ON bill_items(bill_id);
-        CREATE INDEX IF NOT EXISTS idx_bill_items_inventory_id ON bill_items(inventory_id);
-        CREATE INDEX IF NOT EXISTS idx_stock_movements_inventory_id ON stock_movements(inventory_id);
-
-        -- ✅ Conditional unique constraint (only for active items)
-        CREATE UNIQUE INDEX IF NOT EXISTS unique_category_item_no_active 
-        ON inventory (category_id, category_item_no)
-        WHERE status IN ('AVAILABLE', 'RESERVED');
-
-        -- Triggers for auto-updating 'updated_at'
-        CREATE TRIGGER IF NOT EXISTS update_categories_updated_at 
-            AFTER UPDATE ON categories FOR EACH ROW 
-            BEGIN 
-                UPDATE categories SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; 
-            END;
-
-        CREATE TRIGGER IF NOT EXISTS update_suppliers_updated_at 
-            AFTER UPDATE ON suppliers FOR EACH ROW 
-            BEGIN 
-                UPDATE suppliers SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; 
-            END;
-
-        CREATE TRIGGER IF NOT EXISTS update_inventory_updated_at 
-            AFTER UPDATE ON inventory FOR EACH ROW 
-            BEGIN 
-                UPDATE inventory SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; 
-            END;
-
-        CREATE TRIGGER IF NOT EXISTS update_customers_updated_at 
-            AFTER UPDATE ON customers FOR EACH ROW 
-            BEGIN 
-                UPDATE customers SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; 
-            END;
-
-        CREATE TRIGGER IF NOT EXISTS update_bills_updated_at 
-            AFTER UPDATE ON bills FOR EACH ROW 
-            BEGIN 
-                UPDATE bills SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; 
-            END;
-        """
         # Drop old index (if exists) to avoid unique constraint conflicts
         try:
             conn.execute("DROP INDEX IF EXISTS unique_category_item_no;")
         except Exception:
             pass
 
-        conn.executescript(schema_sql)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        # One transaction for the whole script instead of a commit per statement;
+        # a failed statement would otherwise leave the writer inside it
+        try:
+            conn.executescript(f"BEGIN;\n{SCHEMA_SQL}\nCOMMIT;")
+        except Exception:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+
+        # Backfill category_stats when it is first introduced
+        if version < 4:
+            with conn:
+                self._rebuild_category_stats(conn)
+
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
-        conn.close()
 
-        # Add sample data if database is empty
-        self._add_sample_data()
+        # Add sample data to a freshly created database
+        if is_new_database:
+            self._add_sample_data()
 
-    def _add_sample_data(self):
-        """Add sample data if database is empty."""
-        conn = sqlite3.connect(self.db_path)
+        # Fresh statistics so the planner walks idx_inventory_available in
+        # category order instead of sorting get_products
+        conn.execute("ANALYZE")
 
-        # Check if categories exist
-        cursor = conn.execute("SELECT COUNT(*) FROM categories")
-        if cursor.fetchone()[0] == 0:
-            # Add sample categories
-            categories = [
-                ("Ring", "Gold and silver rings"),
-                ("Chain", "Gold and silver chains"),
-                ("Necklace", "Traditional and modern necklaces"),
-                ("Earrings", "Stud and drop earrings"),
-                ("Bangles", "Gold and silver bangles"),
-            ]
+    def _rebuild_category_stats(self, conn):
+        """Recompute category_stats from the inventory table."""
+        conn.execute("DELETE FROM category_stats")
+        conn.execute(
+            """
+            INSERT INTO category_stats
+            SELECT
+                c.id,
+                COUNT(*) FILTER (WHERE i.status = 'AVAILABLE'),
+                COUNT(*) FILTER (WHERE i.status = 'SOLD'),
+                COUNT(*) FILTER (WHERE i.status = 'RESERVED'),
+                COUNT(i.category_id),
+                IFNULL(SUM(i.gross_weight_mg) FILTER (WHERE i.status = 'AVAILABLE'), 0),
+                IFNULL(SUM(i.net_weight_mg) FILTER (WHERE i.status = 'AVAILABLE'), 0),
+                IFNULL(SUM(i.gross_weight_mg), 0),
+                IFNULL(SUM(i.net_weight_mg), 0)
+            FROM categories c
+            LEFT JOIN inventory i ON c.id = i.category_id
+            GROUP BY c.id
+            """
+        )
 
+    @_serialized_write
+    def _add_sample_data(self):
+        """Add sample categories and suppliers (existing names/codes are kept)."""
+        conn = self._conn
+
+        # Sample categories
+        categories = [
+            ("Ring", "Gold and silver rings"),
+            ("Chain", "Gold and silver chains"),
+            ("Necklace", "Traditional and modern necklaces"),
+            ("Earrings", "Stud and drop earrings"),
+            ("Bangles", "Gold and silver bangles"),
+        ]
+
+        # Sample suppliers
+        suppliers = [
+            (
+                "Golden Crafts Ltd",
+                "GCL001",
+                "Rajesh Kumar",
+                "+91-9876543210",
+                "rajesh@goldencrafts.com",
+            ),
+            (
+                "Silver Palace",
+                "SP002",
+                "Priya Sharma",
+                "+91-9876543211",
+                "priya@silverpalace.com",
+            ),
+        ]
+
+        # Unique name/code make the seeding idempotent; both run in one transaction
+        with conn:
             conn.executemany(
-                "INSERT INTO categories (name, description) VALUES (?, ?)", categories
+                "INSERT OR IGNORE INTO categories (name, description) VALUES (?, ?)",
+                categories,
             )
-
-            # Add sample suppliers
-            suppliers = [
-                (
-                    "Golden Crafts Ltd",
-                    "GCL001",
-                    "Rajesh Kumar",
-                    "+91-9876543210",
-                    "rajesh@goldencrafts.com",
-                ),
-                (
-                    "Silver Palace",
-                    "SP002",
-                    "Priya Sharma",
-                    "+91-9876543211",
-                    "priya@silverpalace.com",
-                ),
-            ]
-
             conn.executemany(
-                "INSERT INTO suppliers (name, code, contact_person, phone, email) VALUES (?, ?, ?, ?, ?)",
+                "INSERT OR IGNORE INTO suppliers (name, code, contact_person, phone, email) VALUES (?, ?, ?, ?, ?)",
                 suppliers,
             )
 
-            conn.commit()
-
-        conn.close()
+    def _close_readers(self):
+        """Close the pooled reader connections (new ones open on demand)."""
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
 
     def close(self):
         """Close database connection."""
-        pass  # SQLite connections are opened per operation
+        self._read_cache.cache_clear()
+        self._close_readers()
+        with self._version_lock:
+            if self._version_conn is not None:
+                self._version_conn.close()
+                self._version_conn = None
+        # Refresh query planner statistics for tables whose usage changed
+        try:
+            self._conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+        self._conn.close()
 
     def get_connection(self):
         """Get database connection."""
-        return sqlite3.connect(self.db_path)
+        return self._conn
+
+    def read_connection(self):
+        """Borrow a pooled read-only connection, for use in a with statement."""
+        return self._read()
+
+    def backup_database(self, file_path: str) -> None:
+        """Copy the database (including un-checkpointed WAL pages) to file_path."""
+        backup_conn = sqlite3.connect(file_path)
+        try:
+            # The backup runs on the shared writer, so keep other writes out
+            with self._write_lock:
+                self._conn.backup(backup_conn)
+        finally:
+            backup_conn.close()
+
+    @_serialized_write
+    def restore_database(self, file_path: str) -> None:
+        """Replace the database contents with the backup at file_path.
+
+        The backup is copied onto the open connection, so this manager stays
+        usable; backups from older versions are migrated to the current schema.
+        """
+        backup_conn = sqlite3.connect(file_path)
+        try:
+            backup_conn.backup(self._conn)
+        finally:
+            backup_conn.close()
+        self._read_cache.cache_clear()
+        self._close_readers()
+        self.init_database()
 
     # Categories
+    @_cached_read
     def get_categories(self) -> List[Dict]:
         """Get all categories."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.execute("SELECT * FROM categories ORDER BY name")
-        categories = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return categories
+        with self._read() as conn:
+            cursor = conn.execute("SELECT * FROM categories ORDER BY name")
+            categories = [dict(row) for row in cursor.fetchall()]
+            return categories
 
+    @_serialized_write
     def add_category(self, name: str, description: Optional[str] = None) -> str:
         """Add a new category."""
-        category_id = str(uuid.uuid4())
-        conn = sqlite3.connect(self.db_path)
-        conn.execute(
-            "INSERT INTO categories (id, name, description) VALUES (?, ?, ?)",
-            (category_id, name, description),
-        )
-        conn.commit()
-        conn.close()
+        conn = self._conn
+        with conn:
+            # id comes from the column DEFAULT
+            category_id = _insert_returning_id(
+                conn,
+                "categories",
+                "INSERT INTO categories (name, description) VALUES (?, ?)",
+                (name, description),
+            )
         return category_id
 
+    @_serialized_write
     def update_category(
         self, category_id: str, name: str, description: str = None
     ) -> bool:
         """Update a category."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute(
-                "UPDATE categories SET name = ?, description = ? WHERE id = ?",
-                (name, description, category_id),
-            )
-            conn.commit()
-            conn.close()
+            conn = self._conn
+            with conn:
+                conn.execute(
+                    "UPDATE categories SET name = ?, description = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                    (name, description, category_id),
+                )
             return True
         except Exception as e:
             print(f"Error updating category: {e}")
             return False
 
+    @_serialized_write
     def delete_category(self, category_id: str) -> bool:
         """Delete a category."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn
 
-            # Check if category is used by inventory
-            cursor = conn.execute(
-                "SELECT id FROM inventory WHERE category_id = ? LIMIT 1",
-                (category_id,),
-            )
-            if cursor.fetchone():
-                conn.close()
-                raise ValueError(
-                    "Cannot delete category that is being used by inventory items"
+            with conn:
+                # Delete only if the category is not used by inventory
+                cursor = conn.execute(
+                    """
+                    DELETE FROM categories WHERE id = ?
+                    AND NOT EXISTS (SELECT 1 FROM inventory WHERE category_id = ?)
+                    """,
+                    (category_id, category_id),
                 )
+                # Nothing deleted: either the category is in use or it does not exist
+                if cursor.rowcount == 0 and conn.execute(
+                    "SELECT 1 FROM inventory WHERE category_id = ? LIMIT 1", (category_id,)
+                ).fetchone():
+                    raise ValueError(
+                        "Cannot delete category that is being used by inventory items"
+                    )
 
-            conn.execute("DELETE FROM categories WHERE id = ?", (category_id,))
-            conn.commit()
-            conn.close()
             return True
 
         except ValueError:
@@ -413,15 +1170,15 @@ class LocalDatabaseManager:
             return False
 
     # Suppliers
+    @_cached_read
     def get_suppliers(self) -> List[Dict]:
         """Get all suppliers."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.execute("SELECT * FROM suppliers ORDER BY name")
-        suppliers = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return suppliers
+        with self._read() as conn:
+            cursor = conn.execute("SELECT * FROM suppliers ORDER BY name")
+            suppliers = [dict(row) for row in cursor.fetchall()]
+            return suppliers
 
+    @_serialized_write
     def add_supplier(
         self,
         name: str,
@@ -432,16 +1189,18 @@ class LocalDatabaseManager:
         address: Optional[str] = None,
     ) -> str:
         """Add a new supplier."""
-        supplier_id = str(uuid.uuid4())
-        conn = sqlite3.connect(self.db_path)
-        conn.execute(
-            "INSERT INTO suppliers (id, name, code, contact_person, phone, email, address) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (supplier_id, name, code, contact_person, phone, email, address),
-        )
-        conn.commit()
-        conn.close()
+        conn = self._conn
+        with conn:
+            # id comes from the column DEFAULT
+            supplier_id = _insert_returning_id(
+                conn,
+                "suppliers",
+                "INSERT INTO suppliers (name, code, contact_person, phone, email, address) VALUES (?, ?, ?, ?, ?, ?)",
+                (name, code, contact_person, phone, email, address),
+            )
         return supplier_id
 
+    @_serialized_write
     def update_supplier(
         self,
         supplier_id: str,
@@ -454,37 +1213,40 @@ class LocalDatabaseManager:
     ) -> bool:
         """Update a supplier."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute(
-                "UPDATE suppliers SET name = ?, code = ?, contact_person = ?, phone = ?, email = ?, address = ? WHERE id = ?",
-                (name, code, contact_person, phone, email, address, supplier_id),
-            )
-            conn.commit()
-            conn.close()
+            conn = self._conn
+            with conn:
+                conn.execute(
+                    "UPDATE suppliers SET name = ?, code = ?, contact_person = ?, phone = ?, email = ?, address = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                    (name, code, contact_person, phone, email, address, supplier_id),
+                )
             return True
         except Exception as e:
             print(f"Error updating supplier: {e}")
             return False
 
+    @_serialized_write
     def delete_supplier(self, supplier_id: str) -> bool:
         """Delete a supplier."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn
 
-            # Check if supplier is used by inventory
-            cursor = conn.execute(
-                "SELECT id FROM inventory WHERE supplier_id = ? LIMIT 1",
-                (supplier_id,),
-            )
-            if cursor.fetchone():
-                conn.close()
-                raise ValueError(
-                    "Cannot delete supplier that is being used by inventory items"
+            with conn:
+                # Delete only if the supplier is not used by inventory
+                cursor = conn.execute(
+                    """
+                    DELETE FROM suppliers WHERE id = ?
+                    AND NOT EXISTS (SELECT 1 FROM inventory WHERE supplier_id = ?)
+                    """,
+                    (supplier_id, supplier_id),
                 )
+                # Nothing deleted: either the supplier is in use or it does not exist
+                if cursor.rowcount == 0 and conn.execute(
+                    "SELECT 1 FROM inventory WHERE supplier_id = ? LIMIT 1", (supplier_id,)
+                ).fetchone():
+                    raise ValueError(
+                        "Cannot delete supplier that is being used by inventory items"
+                    )
 
-            conn.execute("DELETE FROM suppliers WHERE id = ?", (supplier_id,))
-            conn.commit()
-            conn.close()
             return True
 
         except ValueError:
@@ -496,46 +1258,39 @@ class LocalDatabaseManager:
     # Products (Inventory)
     def get_products(self) -> List[Dict]:
         """Get all inventory items formatted as products."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.execute(
-            """
-            SELECT i.*, c.name as category_name, s.name as supplier_name, s.code as supplier_code
-            FROM inventory i
-            JOIN categories c ON i.category_id = c.id
-            LEFT JOIN suppliers s ON i.supplier_id = s.id
-            WHERE i.status = 'AVAILABLE'
-            ORDER BY c.name, i.category_item_no
-        """
-        )
+        return list(self.iter_products())
 
-        products = []
-        for row in cursor.fetchall():
-            products.append(
-                {
-                    "id": row["id"],
-                    "name": row["category_name"],  # Use category name as product name
-                    "description": row["description"] or "",
-                    "category_id": row["category_id"],
-                    "category_name": row["category_name"],
-                    "category_item_id": row["category_item_no"],
-                    "hsn_code": row["hsn_code"] or "",
-                    "gross_weight": float(row["gross_weight"]),
-                    "net_weight": float(row["net_weight"]),
-                    "quantity": 1,
-                    "unit_price": 0.0,  # Default value for UI compatibility
-                    "supplier_id": row["supplier_id"],
-                    "supplier_name": row["supplier_name"] or "",
-                    "supplier_code": row["supplier_code"] or "",
-                    "melting_percentage": float(row["melting_percentage"] or 0),
-                    "status": row["status"],
-                    "created_at": row["created_at"],
-                }
+    def iter_products(self, batch_size: int = 512) -> Iterator[Dict]:
+        """Stream available inventory items as product dicts, batch by batch."""
+        with self._read() as conn:
+            # Column order must match _product_from_row
+            cursor = conn.execute(
+                """
+                SELECT i.id, i.category_id, i.category_item_no, i.description, i.hsn_code,
+                       i.gross_weight_mg, i.net_weight_mg, i.supplier_id, i.melting_percentage,
+                       i.status, i.created_at,
+                       c.name as category_name, s.name as supplier_name, s.code as supplier_code
+                FROM inventory i
+                JOIN categories c ON i.category_id = c.id
+                LEFT JOIN suppliers s ON i.supplier_id = s.id
+                WHERE i.status = 'AVAILABLE'
+                ORDER BY c.name, i.category_item_no
+            """
             )
 
-        conn.close()
-        return products
-
+            # Plain tuples are cheaper to fetch than sqlite3.Row objects
+            cursor.row_factory = None
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        return
+                    yield from map(_product_from_row, rows)
+            finally:
+                # Release the statement even if the caller stops early
+                cursor.close()
+
+    @_serialized_write
     def add_product(
         self,
         name: str,
@@ -550,75 +1305,72 @@ class LocalDatabaseManager:
         **kwargs,
     ) -> str:
         """Add inventory items with slot reuse. Name parameter is ignored, category is used as name."""
-        conn = sqlite3.connect(self.db_path)
-        last_item_id: str = ""
+        conn = self._conn
 
         # Save HSN code to history if provided
-        if hsn_code:
-            self.add_or_update_hsn_code_history(hsn_code, description)
-
-        for i in range(quantity):
-            # ✅ Find lowest available or reusable category_item_no
-            cursor = conn.execute(
-                """
-                SELECT n FROM (
-                    WITH RECURSIVE nums(n) AS (
-                        SELECT 1
-                        UNION ALL
-                        SELECT n + 1 FROM nums WHERE n < 10000
-                    )
-                    SELECT nums.n
-                    FROM nums
-                    LEFT JOIN inventory i
-                    ON i.category_id = ? AND i.category_item_no = nums.n
-                    AND i.status IN ('AVAILABLE', 'RESERVED')
-                    WHERE i.category_item_no IS NULL
-                    LIMIT 1
-                )
-            """,
-                (category_id,),
-            )
-            result = cursor.fetchone()
-            category_item_no = result[0] if result and result[0] else 1
-
-            # ✅ Insert new item (removed product_name)
-            item_id = str(uuid.uuid4())
-            conn.execute(
-                """
-                INSERT INTO inventory (
-                    id, category_id, category_item_no, description, 
-                    hsn_code, gross_weight, net_weight, supplier_id, melting_percentage
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    item_id,
-                    category_id,
-                    category_item_no,
-                    description,
-                    hsn_code,
-                    gross_weight,
-                    net_weight,
-                    supplier_id,
-                    melting_percentage,
-                ),
-            )
+        if hsn_code:
+            self.add_or_update_hsn_code_history(hsn_code, description)
 
-            # Add stock movement
-            movement_id = str(uuid.uuid4())
-            conn.execute(
-                """
-                INSERT INTO stock_movements (id, inventory_id, movement_type, quantity, notes)
-                VALUES (?, ?, 'ADDED', 1.0, 'Initial inventory addition')
-            """,
-                (movement_id, item_id),
-            )
+        with conn:
+            used_count, max_used = conn.execute(
+                _SQL_ACTIVE_ITEM_NUMBERS, (category_id,)
+            ).fetchone()
 
-            last_item_id = item_id
+            if used_count == max_used:
+                # No gaps to reuse: number sequentially after the highest slot
+                item_numbers = list(range(max_used + 1, max_used + quantity + 1))
+            else:
+                # ✅ Find the lowest available or reusable category_item_no slots,
+                # one per item, in a single query
+                cursor = conn.execute(_SQL_FREE_ITEM_NUMBERS, (category_id, quantity))
+                item_numbers = [row[0] for row in cursor.fetchall()]
+                if len(item_numbers) < quantity:
+                    raise ValueError("No free item numbers left in this category")
+
+            # ✅ Insert new items (removed product_name) and their stock movements
+            if _SQLITE_HAS_RETURNING:
+                cursor = conn.execute(
+                    _SQL_INSERT_INVENTORY,
+                    (
+                        category_id,
+                        description,
+                        hsn_code,
+                        _to_mg(gross_weight),
+                        _to_mg(net_weight),
+                        supplier_id,
+                        melting_percentage,
+                        json.dumps(item_numbers),
+                    ),
+                )
+                # RETURNING order is unspecified; sort by item number
+                item_rows = sorted(cursor.fetchall(), key=lambda row: row[1])
+            else:
+                item_rows = [
+                    (
+                        _insert_returning_id(
+                            conn,
+                            "inventory",
+                            _SQL_INSERT_INVENTORY_ROW,
+                            (
+                                category_id,
+                                item_no,
+                                description,
+                                hsn_code,
+                                _to_mg(gross_weight),
+                                _to_mg(net_weight),
+                                supplier_id,
+                                melting_percentage,
+                            ),
+                        ),
+                        item_no,
+                    )
+                    for item_no in item_numbers
+                ]
+            conn.executemany(_SQL_INSERT_ADDED_MOVEMENT, [(row[0],) for row in item_rows])
 
-        conn.commit()
-        conn.close()
-        return last_item_id
+        return item_rows[-1][0] if item_rows else ""
 
+    @_serialized_write
     def update_product(
         self,
         product_id: str,
@@ -635,7 +1387,7 @@ class LocalDatabaseManager:
     ) -> bool:
         """Update an inventory item. Note: name parameter is ignored as we use category."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._conn
 
             # Build update query dynamically
             update_fields = []
@@ -652,11 +1404,11 @@ class LocalDatabaseManager:
                 if hsn_code:
                     self.add_or_update_hsn_code_history(hsn_code, description)
             if gross_weight is not None:
-                update_fields.append("gross_weight = ?")
-                update_values.append(gross_weight)
+                update_fields.append("gross_weight_mg = ?")
+                update_values.append(_to_mg(gross_weight))
             if net_weight is not None:
-                update_fields.append("net_weight = ?")
-                update_values.append(net_weight)
+                update_fields.append("net_weight_mg = ?")
+                update_values.append(_to_mg(net_weight))
             if category_id is not None:
                 update_fields.append("category_id = ?")
                 update_values.append(category_id)
@@ -670,49 +1422,53 @@ class LocalDatabaseManager:
             if not update_fields:
                 return True  # Nothing to update
 
+            update_fields.append("updated_at = CURRENT_TIMESTAMP")
+
             # Add product_id to the end of values
             update_values.append(product_id)
 
             query = f"UPDATE inventory SET {', '.join(update_fields)} WHERE id = ?"
-            conn.execute(query, update_values)
-            conn.commit()
-            conn.close()
+            with conn:
+                conn.execute(query, update_values)
             return True
 
         except Exception as e:
             print(f"Error updating product: {e}")
             return False
 
+    @_serialized_write
     def delete_product(self, product_id: str) -> bool:
         """Delete an inventory item."""
         try:
-            conn = sqlite3.connect(self.db_path)
-
-            # Check if item exists and get its status
-            cursor = conn.execute(
-                "SELECT status FROM inventory WHERE id = ?", (product_id,)
-            )
-            result = cursor.fetchone()
-
-            if not result:
-                conn.close()
-                return False
+            conn = self._conn
 
-            if result[0] == "SOLD":
-                conn.close()
-                raise ValueError("Cannot delete sold inventory item")
+            with conn:
+                # Delete related stock movements first (foreign keys are enforced),
+                # guarded by the same status check as the item itself
+                conn.execute(
+                    """
+                    DELETE FROM stock_movements
+                    WHERE inventory_id = ? AND EXISTS (
+                        SELECT 1 FROM inventory WHERE id = ? AND status != 'SOLD'
+                    )
+                    """,
+                    (product_id, product_id),
+                )
 
-            # Delete the inventory item
-            conn.execute("DELETE FROM inventory WHERE id = ?", (product_id,))
+                # Delete the inventory item unless it has been sold
+                cursor = conn.execute(
+                    "DELETE FROM inventory WHERE id = ? AND status != 'SOLD'",
+                    (product_id,),
+                )
 
-            # Also delete related stock movements
-            conn.execute(
-                "DELETE FROM stock_movements WHERE inventory_id = ?", (product_id,)
-            )
+            if cursor.rowcount == 1:
+                return True
 
-            conn.commit()
-            conn.close()
-            return True
+            # Nothing deleted: only look the item up to report why
+            cursor = conn.execute("SELECT 1 FROM inventory WHERE id = ?", (product_id,))
+            if cursor.fetchone():
+                raise ValueError("Cannot delete sold inventory item")
+            return False
 
         except ValueError:
             raise
@@ -727,248 +1483,240 @@ class LocalDatabaseManager:
 
     def get_next_invoice_number(self) -> str:
         """Get next invoice number."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute(
-            "SELECT bill_number FROM bills ORDER BY created_at DESC LIMIT 1"
-        )
-        result = cursor.fetchone()
-        conn.close()
+        with self._read() as conn:
+            cursor = conn.execute(
+                "SELECT bill_number FROM bills ORDER BY created_at DESC LIMIT 1"
+            )
+            result = cursor.fetchone()
 
-        if result:
-            last_bill = result[0]
-            try:
-                parts = last_bill.split("-")
-                if len(parts) >= 3:
+            if result:
+                parts = result[0].split("-")
+                if len(parts) >= 3 and parts[-1].isdigit():
                     prefix = "-".join(parts[:-1])
-                    number = int(parts[-1]) + 1
+                    # Highest number for this prefix, range-scanned on the bill_number index
+                    cursor = conn.execute(
+                        """
+                        SELECT IFNULL(MAX(CAST(substr(bill_number, ?) AS INTEGER)), 0)
+                        FROM bills
+                        WHERE bill_number > ? AND bill_number < ?
+                        """,
+                        (len(prefix) + 2, f"{prefix}-", f"{prefix}."),
+                    )
+                    number = cursor.fetchone()[0] + 1
                     return f"{prefix}-{number:03d}"
-            except:
-                pass
 
-        # Default format
-        current_year = datetime.now().year
-        return f"RK-{current_year}-001"
+            # Default format
+            current_year = datetime.now().year
+            return f"RK-{current_year}-001"
 
     def get_sales_summary(
         self, from_date: Optional[str] = None, to_date: Optional[str] = None
     ) -> Dict:
         """Get sales summary."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-
-        query = "SELECT * FROM bills WHERE status = 'GENERATED'"
-        params = []
-
-        if from_date:
-            query += " AND bill_date >= ?"
-            params.append(from_date)
-        if to_date:
-            query += " AND bill_date <= ?"
-            params.append(to_date)
-
-        cursor = conn.execute(query, params)
-        bills = cursor.fetchall()
-
-        # Columns in bills: see schema; use names for clarity
-        total_sales = sum(float(bill[12]) for bill in bills)  # total_amount
-        total_bills = len(bills)
-
-        # Items sold count and top items
-        total_items = 0
-        top_items: List[Dict] = []
-        if bills:
-            bill_ids = [bill[0] for bill in bills]
-            placeholders = ",".join("?" * len(bill_ids))
-
-            # Total items
-            cur2 = conn.execute(
-                f"SELECT COUNT(*) FROM bill_items WHERE bill_id IN ({placeholders})",
-                bill_ids,
-            )
-            total_items = cur2.fetchone()[0] or 0
-
-            # Top items aggregated by description
-            cur3 = conn.execute(
+        with self._read() as conn:
+            date_clause = ""
+            params = []
+
+            if from_date:
+                date_clause += " AND b.bill_date >= ?"
+                params.append(from_date)
+            if to_date:
+                date_clause += " AND b.bill_date <= ?"
+                params.append(to_date)
+
+            total_bills, total_paise = conn.execute(
                 f"""
-                SELECT 
-                    description AS item_desc,
-                    COUNT(*) AS total_sold,
-                    COALESCE(SUM(amount), 0) AS total_revenue
-                FROM bill_items
-                WHERE bill_id IN ({placeholders})
-                GROUP BY description
-                ORDER BY total_sold DESC, total_revenue DESC
-                LIMIT 20
+                SELECT COUNT(*), IFNULL(SUM(b.total_amount_paise), 0)
+                FROM bills b
+                WHERE b.status = 'GENERATED'{date_clause}
                 """,
-                bill_ids,
-            )
-            top_items = [
-                {
-                    "description": row[0],
-                    "total_sold": float(row[1]),
-                    "total_revenue": float(row[2]),
-                }
-                for row in cur3.fetchall()
-            ]
-
-        conn.close()
-
-        # Return with aliases to match UI expectations
-        average_sale = (total_sales / total_bills) if total_bills > 0 else 0.0
-        return {
-            "total_sales": total_sales,
-            "total_invoices": total_bills,
-            "invoice_count": total_bills,  # UI expects this key
-            "total_items_sold": total_items,
-            "average_invoice_value": average_sale,
-            "average_sale": average_sale,  # UI expects this key
-            "top_items": top_items,
-        }
+                params,
+            ).fetchone()
+            total_sales = total_paise / PAISE_PER_RUPEE
+
+            # Items sold count and top items
+            total_items = 0
+            top_items: List[Dict] = []
+            if total_bills:
+                # Total items
+                total_items = conn.execute(
+                    f"""
+                    SELECT COUNT(*)
+                    FROM bill_items bi
+                    JOIN bills b ON bi.bill_id = b.id
+                    WHERE b.status = 'GENERATED'{date_clause}
+                    """,
+                    params,
+                ).fetchone()[0]
+
+                # Top items aggregated by description
+                cur3 = conn.execute(
+                    f"""
+                    SELECT 
+                        bi.description AS item_desc,
+                        COUNT(*) AS total_sold,
+                        IFNULL(SUM(bi.amount_paise), 0) AS total_revenue
+                    FROM bill_items bi
+                    JOIN bills b ON bi.bill_id = b.id
+                    WHERE b.status = 'GENERATED'{date_clause}
+                    GROUP BY bi.description
+                    ORDER BY total_sold DESC, total_revenue DESC
+                    LIMIT 20
+                    """,
+                    params,
+                )
+                top_items = [
+                    {
+                        "description": row[0],
+                        "total_sold": float(row[1]),
+                        "total_revenue": row[2] / PAISE_PER_RUPEE,
+                    }
+                    for row in cur3.fetchall()
+                ]
+
+            # Return with aliases to match UI expectations
+            average_sale = (total_sales / total_bills) if total_bills > 0 else 0.0
+            return {
+                "total_sales": total_sales,
+                "total_invoices": total_bills,
+                "invoice_count": total_bills,  # UI expects this key
+                "total_items_sold": total_items,
+                "average_invoice_value": average_sale,
+                "average_sale": average_sale,  # UI expects this key
+                "top_items": top_items,
+            }
 
+    @_cached_read
     def get_low_stock_products(self, threshold: int = 5) -> List[Dict]:
         """Get categories with low stock."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-
-        cursor = conn.execute(
-            """
-            SELECT 
-                c.id as category_id,
-                c.name as category_name,
-                COUNT(CASE WHEN i.status = 'AVAILABLE' THEN 1 END) as available_items,
-                COUNT(i.id) as total_items,
-                COUNT(CASE WHEN i.status = 'SOLD' THEN 1 END) as sold_items,
-                COALESCE(SUM(CASE WHEN i.status = 'AVAILABLE' THEN i.gross_weight END), 0) as available_gross_weight,
-                COALESCE(SUM(CASE WHEN i.status = 'AVAILABLE' THEN i.net_weight END), 0) as available_net_weight
-            FROM categories c
-            LEFT JOIN inventory i ON c.id = i.category_id
-            GROUP BY c.id, c.name
-            HAVING available_items <= ?
-            ORDER BY c.name
-        """,
-            (threshold,),
-        )
-
-        low_stock = []
-        for row in cursor.fetchall():
-            low_stock.append(
-                {
-                    "id": row["category_id"],
-                    "name": row["category_name"],
-                    "category_name": row["category_name"],
-                    "quantity": row["available_items"],
-                    "available_quantity": row["available_items"],
-                    "unit_price": 0.0,
-                    "available_gross_weight": float(row["available_gross_weight"]),
-                    "available_net_weight": float(row["available_net_weight"]),
-                    "total_items": row["total_items"],
-                    "sold_items": row["sold_items"],
-                }
-            )
-
-        conn.close()
-        return low_stock
+        with self._read() as conn:
+            # Every output key (including UI aliases) is a column, already
+            # converted to grams, so rows map straight onto dicts
+            cursor = conn.execute(_SQL_LOW_STOCK, (threshold,))
+            return list(_iter_dicts(cursor))
 
+    @_serialized_write
     def generate_invoice_with_stock_deduction(
         self, invoice_data: Dict, line_items: List[Dict]
     ) -> tuple:
         """Generate invoice with stock deduction."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
 
         try:
             warnings = []
 
-            # Create bill
-            bill_id = str(uuid.uuid4())
-            conn.execute(
-                """
-                INSERT INTO bills (id, bill_number, customer_name, customer_phone, customer_gstin,
-                                 bill_date, subtotal, cgst_rate, sgst_rate, cgst_amount, sgst_amount,
-                                 total_amount, rounded_off)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            # Create bill; SQLite assigns the integer id
+            bill_id = conn.execute(
+                _SQL_INSERT_BILL,
                 (
-                    bill_id,
                     invoice_data["invoice_number"],
                     invoice_data["customer_name"],
                     invoice_data.get("customer_phone"),
                     invoice_data.get("customer_gstin"),
-                    invoice_data.get("invoice_date", str(date.today())),
-                    invoice_data.get("subtotal", 0),
+                    invoice_data.get("invoice_date") or date.today().isoformat(),
+                    _to_paise(invoice_data.get("subtotal", 0)),
                     invoice_data.get("cgst_rate", 1.5),
                     invoice_data.get("sgst_rate", 1.5),
-                    invoice_data.get("cgst_amount", 0),
-                    invoice_data.get("sgst_amount", 0),
-                    invoice_data.get("total_amount", 0),
-                    invoice_data.get("rounded_off", 0),
+                    _to_paise(invoice_data.get("cgst_amount", 0)),
+                    _to_paise(invoice_data.get("sgst_amount", 0)),
+                    _to_paise(invoice_data.get("total_amount", 0)),
+                    _to_paise(invoice_data.get("rounded_off", 0)),
                 ),
+            ).lastrowid
+
+            # Only items linked to inventory take part in the stock update.
+            # Flip every available linked item to SOLD in one statement;
+            # RETURNING reports which items were actually sold
+            product_ids = list(
+                {item["product_id"] for item in line_items if item.get("product_id")}
             )
+            sellable = set()
+            # Chunked to stay under SQLite's bound-parameter limit
+            for start in range(0, len(product_ids), MAX_SQL_PARAMS):
+                chunk = product_ids[start : start + MAX_SQL_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                if _SQLITE_HAS_RETURNING:
+                    cursor = conn.execute(
+                        f"""
+                        UPDATE inventory SET status = 'SOLD', updated_at = CURRENT_TIMESTAMP
+                        WHERE id IN ({placeholders}) AND status = 'AVAILABLE'
+                        RETURNING id
+                        """,
+                        chunk,
+                    )
+                    sellable.update(row[0] for row in cursor.fetchall())
+                else:
+                    # The bill INSERT already holds the write lock, so nothing
+                    # can change between the SELECT and the UPDATE
+                    chunk_sellable = [
+                        row[0]
+                        for row in conn.execute(
+                            f"""
+                            SELECT id FROM inventory
+                            WHERE id IN ({placeholders}) AND status = 'AVAILABLE'
+                            """,
+                            chunk,
+                        )
+                    ]
+                    if chunk_sellable:
+                        conn.execute(
+                            f"""
+                            UPDATE inventory SET status = 'SOLD', updated_at = CURRENT_TIMESTAMP
+                            WHERE id IN ({",".join("?" * len(chunk_sellable))})
+                            """,
+                            chunk_sellable,
+                        )
+                    sellable.update(chunk_sellable)
 
-            # Process line items
+            # Build bill items and warnings in one pass, so warnings keep their
+            # per-line order. Only lines that sold their item keep the inventory
+            # link; a deleted or already sold product would fail the foreign key
+            bill_item_rows = []
+            sold_ids = []
             for item in line_items:
-                item_id = str(uuid.uuid4())
                 product_id = item.get("product_id")
+                inventory_id = None
+                if not product_id:
+                    warnings.append(
+                        f"Item '{item.get('name')}' is not linked to inventory"
+                    )
+                elif product_id in sellable:
+                    # A repeated line item is only sold once
+                    sellable.discard(product_id)
+                    sold_ids.append(product_id)
+                    inventory_id = product_id
+                else:
+                    warnings.append(
+                        f"Item '{item.get('name')}' is not available for sale"
+                    )
 
                 # Build description from item data
                 item_description = item.get("description", "")
                 if not item_description and item.get("name"):
                     item_description = item.get("name")
 
-                # Add bill item (removed product_name)
-                conn.execute(
-                    """
-                    INSERT INTO bill_items (id, bill_id, inventory_id, description,
-                                          hsn_code, quantity, rate, amount)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                bill_item_rows.append(
                     (
-                        item_id,
                         bill_id,
-                        product_id,
+                        inventory_id,
                         item_description,
                         item.get("hsn_code", ""),
-                        item.get("quantity", 1),
-                        item.get("rate", 0),
-                        item.get("amount", 0),
-                    ),
-                )
-
-                # Update inventory status if linked to product
-                if product_id:
-                    cursor = conn.execute(
-                        "SELECT status FROM inventory WHERE id = ?", (product_id,)
+                        _to_mg(item.get("quantity", 1)),
+                        _to_paise(item.get("rate", 0)),
+                        _to_paise(item.get("amount", 0)),
                     )
-                    result = cursor.fetchone()
-
-                    if result and result[0] == "AVAILABLE":
-                        conn.execute(
-                            "UPDATE inventory SET status = 'SOLD' WHERE id = ?",
-                            (product_id,),
-                        )
+                )
+            conn.executemany(_SQL_INSERT_BILL_ITEM, bill_item_rows)
 
-                        # Add stock movement
-                        movement_id = str(uuid.uuid4())
-                        conn.execute(
-                            """
-                            INSERT INTO stock_movements (id, inventory_id, movement_type, reference_id,
-                                                        reference_type, quantity, notes)
-                            VALUES (?, ?, 'SOLD', ?, 'BILL', 1.0, ?)
-                        """,
-                            (
-                                movement_id,
-                                product_id,
-                                bill_id,
-                                f"Sold via bill {invoice_data['invoice_number']}",
-                            ),
-                        )
-                    else:
-                        warnings.append(
-                            f"Item '{item.get('name')}' is not available for sale"
-                        )
-                else:
-                    warnings.append(
-                        f"Item '{item.get('name')}' is not linked to inventory"
-                    )
+            # Add stock movements in one batch
+            notes = f"Sold via bill {invoice_data['invoice_number']}"
+            conn.executemany(
+                _SQL_INSERT_MOVEMENT,
+                [
+                    (product_id, bill_id, notes)
+                    for product_id in sold_ids
+                ],
+            )
 
             conn.commit()
             return str(bill_id), warnings
@@ -976,52 +1724,69 @@ class LocalDatabaseManager:
         except Exception as e:
             conn.rollback()
             raise Exception(f"Error generating invoice: {e}")
-        finally:
-            conn.close()
 
     # Additional required methods
+    @_cached_read
     def get_invoices(self, limit: int = 100) -> List[Dict]:
         """Get recent invoices."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.execute(
-            "SELECT * FROM bills ORDER BY created_at DESC LIMIT ?", (limit,)
-        )
-        invoices = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return invoices
+        return list(self.iter_invoices(limit))
+
+    def iter_invoices(self, limit: int = 100) -> Iterator[Dict]:
+        """Stream recent invoices without materializing them all."""
+        with self._read() as conn:
+            cursor = conn.execute(
+                """
+                SELECT id, bill_number, customer_id, customer_name, customer_phone,
+                       customer_gstin, bill_date, subtotal_paise, cgst_rate, sgst_rate,
+                       cgst_amount_paise, sgst_amount_paise, total_amount_paise,
+                       rounded_off_paise, status, created_at
+                FROM bills
+                ORDER BY created_at DESC
+                LIMIT ?
+                """,
+                (limit,),
+            )
+            yield from _iter_decoded(cursor)
 
     def get_stock_movements(
         self, inventory_id: Optional[str] = None, limit: int = 100
     ) -> List[Dict]:
         """Get stock movements, optionally filtered by inventory ID."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        return list(self.iter_stock_movements(inventory_id, limit))
 
-        if inventory_id:
-            cursor = conn.execute(
-                "SELECT * FROM stock_movements WHERE inventory_id = ? ORDER BY created_at DESC LIMIT ?",
-                (inventory_id, limit),
-            )
-        else:
-            cursor = conn.execute(
-                "SELECT * FROM stock_movements ORDER BY created_at DESC LIMIT ?",
-                (limit,),
+    def iter_stock_movements(
+        self, inventory_id: Optional[str] = None, limit: int = 100
+    ) -> Iterator[Dict]:
+        """Stream stock movements, optionally filtered by inventory ID."""
+        with self._read() as conn:
+            columns = (
+                "id, inventory_id, movement_type, reference_id, reference_type, "
+                "quantity, notes, created_at"
             )
 
-        movements = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return movements
+            if inventory_id:
+                cursor = conn.execute(
+                    f"SELECT {columns} FROM stock_movements WHERE inventory_id = ? ORDER BY created_at DESC LIMIT ?",
+                    (inventory_id, limit),
+                )
+            else:
+                cursor = conn.execute(
+                    f"SELECT {columns} FROM stock_movements ORDER BY created_at DESC LIMIT ?",
+                    (limit,),
+                )
+
+            yield from _iter_dicts(cursor)
 
+    @_cached_read
     def get_customers(self) -> List[Dict]:
         """Get all customers."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.execute("SELECT * FROM customers ORDER BY name")
-        customers = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return customers
+        with self._read() as conn:
+            cursor = conn.execute(
+                "SELECT id, name, phone, email, address, gstin FROM customers ORDER BY name"
+            )
+            return list(_iter_dicts(cursor))
 
+    @_serialized_write
     def add_customer(
         self,
         name: str,
@@ -1031,118 +1796,83 @@ class LocalDatabaseManager:
         gstin: Optional[str] = None,
     ) -> str:
         """Add a new customer."""
-        customer_id = str(uuid.uuid4())
-        conn = sqlite3.connect(self.db_path)
-        conn.execute(
-            "INSERT INTO customers (id, name, phone, email, address, gstin) VALUES (?, ?, ?, ?, ?, ?)",
-            (customer_id, name, phone, email, address, gstin),
-        )
-        conn.commit()
-        conn.close()
+        conn = self._conn
+        with conn:
+            # id comes from the column DEFAULT
+            customer_id = _insert_returning_id(
+                conn,
+                "customers",
+                "INSERT INTO customers (name, phone, email, address, gstin) VALUES (?, ?, ?, ?, ?)",
+                (name, phone, email, address, gstin),
+            )
         return customer_id
 
+    @_cached_read
     def get_category_summary(self) -> List[Dict]:
         """Get inventory summary by category."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-
-        cursor = conn.execute(
+        with self._read() as conn:
+            # Provide both legacy "*_count" and UI-expected "*_items"/"total_items"
+            # keys; weights arrive already converted to grams
+            cursor = conn.execute(
+                """
+                SELECT 
+                    c.id as category_id,
+                    c.name as category_name,
+                    s.available_count,
+                    s.sold_count,
+                    s.reserved_count,
+                    s.total_count,
+                    s.available_count as available_items,
+                    s.sold_count as sold_items,
+                    s.total_count as total_items,
+                    s.available_gross_weight_mg / 1000.0 as available_gross_weight,
+                    s.available_net_weight_mg / 1000.0 as available_net_weight,
+                    s.total_gross_weight_mg / 1000.0 as total_gross_weight,
+                    s.total_net_weight_mg / 1000.0 as total_net_weight
+                FROM categories c
+                JOIN category_stats s ON s.category_id = c.id
+                ORDER BY c.name
             """
-            SELECT 
-                c.id as category_id,
-                c.name as category_name,
-                COUNT(CASE WHEN i.status = 'AVAILABLE' THEN 1 END) as available_count,
-                COUNT(CASE WHEN i.status = 'SOLD' THEN 1 END) as sold_count,
-                COUNT(CASE WHEN i.status = 'RESERVED' THEN 1 END) as reserved_count,
-                COUNT(i.id) as total_count,
-                COALESCE(SUM(CASE WHEN i.status = 'AVAILABLE' THEN i.gross_weight END), 0) as available_gross_weight,
-                COALESCE(SUM(CASE WHEN i.status = 'AVAILABLE' THEN i.net_weight END), 0) as available_net_weight,
-                COALESCE(SUM(i.gross_weight), 0) as total_gross_weight,
-                COALESCE(SUM(i.net_weight), 0) as total_net_weight
-            FROM categories c
-            LEFT JOIN inventory i ON c.id = i.category_id
-            GROUP BY c.id, c.name
-            ORDER BY c.name
-        """
-        )
-
-        summary = []
-        for row in cursor.fetchall():
-            # Provide both legacy "*_count" and UI-expected "*_items"/"total_items" keys
-            item = {
-                "category_id": row["category_id"],
-                "category_name": row["category_name"],
-                # Counts
-                "available_count": row["available_count"],
-                "sold_count": row["sold_count"],
-                "reserved_count": row["reserved_count"],
-                "total_count": row["total_count"],
-                # UI-expected aliases
-                "available_items": row["available_count"],
-                "sold_items": row["sold_count"],
-                "total_items": row["total_count"],
-                # Weights
-                "available_gross_weight": float(row["available_gross_weight"]),
-                "available_net_weight": float(row["available_net_weight"]),
-                "total_gross_weight": float(row["total_gross_weight"]),
-                "total_net_weight": float(row["total_net_weight"]),
-            }
-            summary.append(item)
-
-        conn.close()
-        return summary
+            )
+            return list(_iter_dicts(cursor))
 
     def get_total_summary(self) -> Dict:
         """Get overall inventory summary to match UI expectations."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.execute(
-            """
-            SELECT 
-                COUNT(CASE WHEN status = 'AVAILABLE' THEN 1 END) AS total_available_items,
-                COUNT(CASE WHEN status = 'SOLD' THEN 1 END) AS total_sold_items,
-                COALESCE(SUM(CASE WHEN status = 'AVAILABLE' THEN gross_weight END), 0) AS total_available_gross_weight,
-                COALESCE(SUM(CASE WHEN status = 'AVAILABLE' THEN net_weight END), 0) AS total_available_net_weight
-            FROM inventory
-            """
-        )
-        row = cursor.fetchone()
-        conn.close()
-
-        if not row:
-            return {
-                "total_available_items": 0,
-                "total_sold_items": 0,
-                "total_available_gross_weight": 0.0,
-                "total_available_net_weight": 0.0,
-            }
-
+        # Derived from the (cached) category summary the UI loads alongside it,
+        # so showing both costs a single query
+        summary = self.get_category_summary()
         return {
-            "total_available_items": int(row[0] or 0),
-            "total_sold_items": int(row[1] or 0),
-            "total_available_gross_weight": float(row[2] or 0.0),
-            "total_available_net_weight": float(row[3] or 0.0),
+            "total_available_items": sum(c["available_count"] for c in summary),
+            "total_sold_items": sum(c["sold_count"] for c in summary),
+            # Weights are whole milligrams, so rounding drops float noise
+            "total_available_gross_weight": round(
+                sum(c["available_gross_weight"] for c in summary), 3
+            ),
+            "total_available_net_weight": round(
+                sum(c["available_net_weight"] for c in summary), 3
+            ),
         }
 
     def get_invoice_items(self, invoice_id: str) -> List[Dict]:
         """Get items for a specific invoice (local SQLite)."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.execute(
-            "SELECT * FROM bill_items WHERE bill_id = ? ORDER BY created_at ASC",
-            (invoice_id,),
-        )
-        items = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return items
+        with self._read() as conn:
+            cursor = conn.execute(
+                """
+                SELECT id, bill_id, inventory_id, description, hsn_code,
+                       quantity_mg, rate_paise, amount_paise, created_at
+                FROM bill_items
+                WHERE bill_id = ?
+                ORDER BY created_at ASC
+                """,
+                (invoice_id,),
+            )
+            return list(_iter_decoded(cursor))
 
+    @_serialized_write
     def clear_all_data(self) -> bool:
         """Clear all data from the database while keeping the schema."""
+        conn = self._conn
         try:
-            conn = sqlite3.connect(self.db_path)
-
-            # Disable foreign key constraints temporarily
-            conn.execute("PRAGMA foreign_keys = OFF")
-
             # Clear all tables in the correct order (respecting foreign key relationships)
             tables_to_clear = [
                 "stock_movements",
@@ -1154,24 +1884,32 @@ class LocalDatabaseManager:
                 "categories",
             ]
 
-            for table in tables_to_clear:
-                conn.execute(f"DELETE FROM {table}")
-                print(f"Cleared table: {table}")
-
-            # Re-enable foreign key constraints
-            conn.execute("PRAGMA foreign_keys = ON")
+            # One script, one transaction; the PRAGMA runs before BEGIN because
+            # foreign_keys cannot be changed inside a transaction
+            conn.executescript(
+                "PRAGMA foreign_keys = OFF; BEGIN; "
+                + " ".join(f"DELETE FROM {table};" for table in tables_to_clear)
+                + " COMMIT;"
+            )
+            print(f"Cleared tables: {', '.join(tables_to_clear)}")
 
-            conn.commit()
-            conn.close()
+            # Return the freed pages to the OS
+            conn.execute("VACUUM")
 
             print("✅ All database data cleared successfully!")
             print("📋 Database schema preserved.")
             return True
 
         except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
             print(f"❌ Error clearing database: {e}")
             return False
+        finally:
+            # Re-enable foreign key constraints on the shared connection
+            conn.execute("PRAGMA foreign_keys = ON")
 
+    @_serialized_write
     def reset_database(self) -> bool:
         """Reset database by clearing all data and re-adding sample data."""
         if self.clear_all_data():
@@ -1181,17 +1919,16 @@ class LocalDatabaseManager:
         return False
 
     # HSN Code History Methods
+    @_cached_read
     def get_hsn_code_history(self) -> List[Dict]:
         """Get all HSN codes from history."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.execute(
-            "SELECT * FROM hsn_code_history ORDER BY last_used DESC LIMIT 100"
-        )
-        history = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return history
+        with self._read() as conn:
+            cursor = conn.execute(
+                "SELECT hsn_code, description, last_used FROM hsn_code_history ORDER BY last_used DESC LIMIT 100"
+            )
+            return list(_iter_dicts(cursor))
 
+    @_serialized_write
     def add_or_update_hsn_code_history(
         self, hsn_code: str, description: Optional[str] = None
     ) -> None:
@@ -1199,119 +1936,110 @@ class LocalDatabaseManager:
         if not hsn_code or not hsn_code.strip():
             return
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         try:
-            # Check if HSN code already exists
-            cursor = conn.execute(
-                "SELECT id FROM hsn_code_history WHERE hsn_code = ?", (hsn_code,)
-            )
-            existing = cursor.fetchone()
-
-            if existing:
-                # Update last_used timestamp and description if provided
-                if description:
-                    conn.execute(
-                        "UPDATE hsn_code_history SET last_used = CURRENT_TIMESTAMP, description = ? WHERE hsn_code = ?",
-                        (description, hsn_code),
-                    )
-                else:
-                    conn.execute(
-                        "UPDATE hsn_code_history SET last_used = CURRENT_TIMESTAMP WHERE hsn_code = ?",
-                        (hsn_code,),
-                    )
-            else:
-                # Insert new HSN code
-                hsn_id = str(uuid.uuid4())
+            # Insert, or bump last_used (and description if provided) in one statement
+            with conn:
                 conn.execute(
-                    "INSERT INTO hsn_code_history (id, hsn_code, description) VALUES (?, ?, ?)",
-                    (hsn_id, hsn_code, description),
+                    """
+                    INSERT INTO hsn_code_history (hsn_code, description)
+                    VALUES (?, ?)
+                    ON CONFLICT(hsn_code) DO UPDATE SET
+                        last_used = CURRENT_TIMESTAMP,
+                        description = COALESCE(
+                            NULLIF(excluded.description, ''), hsn_code_history.description
+                        )
+                    """,
+                    (hsn_code, description),
                 )
-
-            conn.commit()
         except Exception as e:
             print(f"Error adding/updating HSN history: {e}")
-            conn.rollback()
-        finally:
-            conn.close()
 
     def export_category_wise_csv(self, category_id: str, file_path: str) -> bool:
         """Export category-wise inventory to CSV with sr.no, description, hsn code, supplier code."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            with self._read() as conn:
+                # Get category name
+                cursor = conn.execute(
+                    "SELECT name FROM categories WHERE id = ?", (category_id,)
+                )
+                category_row = cursor.fetchone()
+                if not category_row:
+                    return False
 
-            # Get category name
-            cursor = conn.execute(
-                "SELECT name FROM categories WHERE id = ?", (category_id,)
-            )
-            category_row = cursor.fetchone()
-            if not category_row:
-                conn.close()
-                return False
+                category_name = category_row[0]
 
-            category_name = category_row["name"]
+                # Get inventory items for this category
+                cursor = conn.execute(
+                    """
+                    SELECT 
+                        i.category_item_no,
+                        i.description,
+                        i.hsn_code,
+                        i.gross_weight_mg,
+                        i.net_weight_mg,
+                        s.code as supplier_code,
+                        i.status,
+                        i.created_at
+                    FROM inventory i
+                    LEFT JOIN suppliers s ON i.supplier_id = s.id
+                    WHERE i.category_id = ?
+                    ORDER BY i.category_item_no
+                    """,
+                    (category_id,),
+                )
+                # Fixed column order above; unpacked positionally below
+                cursor.row_factory = None
 
-            # Get inventory items for this category
-            cursor = conn.execute(
-                """
-                SELECT 
-                    i.category_item_no,
-                    i.description,
-                    i.hsn_code,
-                    i.gross_weight,
-                    i.net_weight,
-                    s.code as supplier_code,
-                    i.status,
-                    i.created_at
-                FROM inventory i
-                LEFT JOIN suppliers s ON i.supplier_id = s.id
-                WHERE i.category_id = ?
-                ORDER BY i.category_item_no
-                """,
-                (category_id,),
-            )
+                # Write to CSV, streaming rows straight from the cursor
+                import csv
 
-            items = cursor.fetchall()
-            conn.close()
-
-            # Write to CSV
-            import csv
-
-            with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.writer(csvfile)
-
-                # Write header
-                writer.writerow(
-                    [
-                        "Sr. No.",
-                        "Category",
-                        "Description",
-                        "HSN Code",
-                        "Supplier Code",
-                        "Gross Weight (g)",
-                        "Net Weight (g)",
-                        "Status",
-                        "Added Date",
-                    ]
-                )
+                with open(
+                    file_path, "w", newline="", encoding="utf-8", buffering=1 << 20
+                ) as csvfile:
+                    writer = csv.writer(csvfile)
 
-                # Write data
-                for idx, item in enumerate(items, 1):
+                    # Write header
                     writer.writerow(
                         [
+                            "Sr. No.",
+                            "Category",
+                            "Description",
+                            "HSN Code",
+                            "Supplier Code",
+                            "Gross Weight (g)",
+                            "Net Weight (g)",
+                            "Status",
+                            "Added Date",
+                        ]
+                    )
+
+                    # Write data
+                    writer.writerows(
+                        (
                             idx,
                             category_name,
-                            item["description"] or "",
-                            item["hsn_code"] or "",
-                            item["supplier_code"] or "",
-                            f"{item['gross_weight']:.3f}",
-                            f"{item['net_weight']:.3f}",
-                            item["status"],
-                            item["created_at"],
-                        ]
+                            description or "",
+                            hsn_code or "",
+                            supplier_code or "",
+                            f"{gross_weight_mg / MG_PER_GRAM:.3f}",
+                            f"{net_weight_mg / MG_PER_GRAM:.3f}",
+                            status,
+                            created_at,
+                        )
+                        for idx, (
+                            _item_no,
+                            description,
+                            hsn_code,
+                            gross_weight_mg,
+                            net_weight_mg,
+                            supplier_code,
+                            status,
+                            created_at,
+                        ) in enumerate(cursor, 1)
                     )
 
-            return True
+                return True
 
         except Exception as e:
             print(f"Error exporting category-wise CSV: {e}")
@@ -1320,92 +2048,87 @@ class LocalDatabaseManager:
     def export_total_summary_csv(self, file_path: str) -> bool:
         """Export total summary CSV with category, gross weight, net weight, no of items."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-
-            # Get category summary
-            cursor = conn.execute(
-                """
-                SELECT 
-                    c.name as category_name,
-                    COUNT(CASE WHEN i.status = 'AVAILABLE' THEN 1 END) as available_items,
-                    COUNT(i.id) as total_items,
-                    COALESCE(SUM(CASE WHEN i.status = 'AVAILABLE' THEN i.gross_weight END), 0) as available_gross_weight,
-                    COALESCE(SUM(CASE WHEN i.status = 'AVAILABLE' THEN i.net_weight END), 0) as available_net_weight,
-                    COALESCE(SUM(i.gross_weight), 0) as total_gross_weight,
-                    COALESCE(SUM(i.net_weight), 0) as total_net_weight
-                FROM categories c
-                LEFT JOIN inventory i ON c.id = i.category_id
-                GROUP BY c.id, c.name
-                ORDER BY c.name
-                """
-            )
-
-            categories = cursor.fetchall()
-            conn.close()
-
-            # Write to CSV
-            import csv
-
-            with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.writer(csvfile)
-
-                # Write header
-                writer.writerow(
-                    [
-                        "Category",
-                        "Total Items",
-                        "Available Items",
-                        "Total Gross Weight (g)",
-                        "Total Net Weight (g)",
-                        "Available Gross Weight (g)",
-                        "Available Net Weight (g)",
-                    ]
+            with self._read() as conn:
+                # Get category summary followed by the TOTAL row
+                cursor = conn.execute(
+                    """
+                    WITH cat AS (
+                        SELECT 
+                            c.name as category_name,
+                            s.total_count as total_items,
+                            s.available_count as available_items,
+                            s.total_gross_weight_mg,
+                            s.total_net_weight_mg,
+                            s.available_gross_weight_mg,
+                            s.available_net_weight_mg
+                        FROM categories c
+                        JOIN category_stats s ON s.category_id = c.id
+                    )
+                    SELECT 0 as is_total, * FROM cat
+                    UNION ALL
+                    SELECT 
+                        1,
+                        'TOTAL',
+                        IFNULL(SUM(total_items), 0),
+                        IFNULL(SUM(available_items), 0),
+                        IFNULL(SUM(total_gross_weight_mg), 0),
+                        IFNULL(SUM(total_net_weight_mg), 0),
+                        IFNULL(SUM(available_gross_weight_mg), 0),
+                        IFNULL(SUM(available_net_weight_mg), 0)
+                    FROM cat
+                    ORDER BY is_total, category_name
+                    """
                 )
+                # Fixed column order above; unpacked positionally below
+                cursor.row_factory = None
+
+                # Write to CSV, streaming rows straight from the cursor
+                import csv
 
-                # Write data
-                total_items = 0
-                total_available = 0
-                total_gross = 0.0
-                total_net = 0.0
-                available_gross = 0.0
-                available_net = 0.0
+                with open(
+                    file_path, "w", newline="", encoding="utf-8", buffering=1 << 20
+                ) as csvfile:
+                    writer = csv.writer(csvfile)
 
-                for cat in categories:
+                    # Write header
                     writer.writerow(
                         [
-                            cat["category_name"],
-                            cat["total_items"],
-                            cat["available_items"],
-                            f"{cat['total_gross_weight']:.3f}",
-                            f"{cat['total_net_weight']:.3f}",
-                            f"{cat['available_gross_weight']:.3f}",
-                            f"{cat['available_net_weight']:.3f}",
+                            "Category",
+                            "Total Items",
+                            "Available Items",
+                            "Total Gross Weight (g)",
+                            "Total Net Weight (g)",
+                            "Available Gross Weight (g)",
+                            "Available Net Weight (g)",
                         ]
                     )
 
-                    total_items += cat["total_items"]
-                    total_available += cat["available_items"]
-                    total_gross += float(cat["total_gross_weight"])
-                    total_net += float(cat["total_net_weight"])
-                    available_gross += float(cat["available_gross_weight"])
-                    available_net += float(cat["available_net_weight"])
-
-                # Write totals row
-                writer.writerow([])
-                writer.writerow(
-                    [
-                        "TOTAL",
+                    # Write data; the totals row is separated by a blank line
+                    for (
+                        is_total,
+                        category_name,
                         total_items,
-                        total_available,
-                        f"{total_gross:.3f}",
-                        f"{total_net:.3f}",
-                        f"{available_gross:.3f}",
-                        f"{available_net:.3f}",
-                    ]
-                )
+                        available_items,
+                        total_gross_mg,
+                        total_net_mg,
+                        available_gross_mg,
+                        available_net_mg,
+                    ) in cursor:
+                        if is_total:
+                            writer.writerow([])
+                        writer.writerow(
+                            [
+                                category_name,
+                                total_items,
+                                available_items,
+                                f"{total_gross_mg / MG_PER_GRAM:.3f}",
+                                f"{total_net_mg / MG_PER_GRAM:.3f}",
+                                f"{available_gross_mg / MG_PER_GRAM:.3f}",
+                                f"{available_net_mg / MG_PER_GRAM:.3f}",
+                            ]
+                        )
 
-            return True
+                return True
 
         except Exception as e:
             print(f"Error exporting total summary CSV: {e}")
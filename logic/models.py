@@ -3,14 +3,21 @@ Data Models for Jewelry Management System
 Supabase/PostgreSQL compatible models
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime, date
 from decimal import Decimal
 from typing import Optional, List
 from uuid import UUID
 
+# Records are immutable and slotted (no per-instance __dict__); slots=True
+# needs Python 3.10, so older interpreters fall back to plain frozen classes
+_RECORD = (
+    {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+)
 
-@dataclass
+
+@dataclass(**_RECORD)
 class Category:
     """Jewelry category model."""
 
@@ -21,7 +28,7 @@ class Category:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(**_RECORD)
 class Supplier:
     """Supplier model."""
 
@@ -36,7 +43,7 @@ class Supplier:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(**_RECORD)
 class InventoryItem:
     """Serialized inventory item model (one row per physical piece)."""
 
@@ -54,7 +61,7 @@ class InventoryItem:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(**_RECORD)
 class Customer:
     """Customer model."""
 
@@ -68,7 +75,7 @@ class Customer:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(**_RECORD)
 class Bill:
     """Bill/Invoice model."""
 
@@ -78,7 +85,7 @@ class Bill:
     customer_name: str = ""
     customer_phone: Optional[str] = None
     customer_gstin: Optional[str] = None
-    bill_date: date = date.today()
+    bill_date: date = field(default_factory=date.today)
     subtotal: Decimal = Decimal("0.00")
     cgst_rate: Decimal = Decimal("1.50")
     sgst_rate: Decimal = Decimal("1.50")
@@ -91,7 +98,7 @@ class Bill:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(**_RECORD)
 class BillItem:
     """Bill item model."""
 
@@ -106,7 +113,7 @@ class BillItem:
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(**_RECORD)
 class StockMovement:
     """Stock movement ledger model."""
 
@@ -120,7 +127,7 @@ class StockMovement:
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(**_RECORD)
 class CategorySummary:
     """Category summary model for analytics."""
 
@@ -133,7 +140,7 @@ class CategorySummary:
     available_net_weight: Decimal
 
 
-@dataclass
+@dataclass(**_RECORD)
 class TotalSummary:
     """Total inventory summary model."""
 
@@ -143,7 +150,7 @@ class TotalSummary:
     total_available_net_weight: Decimal
 
 
-@dataclass
+@dataclass(**_RECORD)
 class CurrentStockItem:
     """Current stock view model for UI display."""
 
@@ -163,7 +170,7 @@ class CurrentStockItem:
     created_at: datetime
 
 
-@dataclass
+@dataclass(**_RECORD)
 class SoldItem:
     """Sold items view model."""
 
@@ -181,7 +188,7 @@ class SoldItem:
     sold_at: datetime
 
 
-@dataclass
+@dataclass(**_RECORD)
 class CategoryCSVData:
     """Category CSV export data model."""
 
@@ -194,7 +201,7 @@ class CategoryCSVData:
 
 
 # Legacy compatibility - map old product model to new inventory item
-@dataclass
+@dataclass(**_RECORD)
 class Product:
     """Legacy product model for backward compatibility with existing UI."""
 
@@ -242,3 +249,4 @@ class Product:
             status=item.status,
             created_at=item.created_at,
         )
+
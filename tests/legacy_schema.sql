@@ -0,0 +1,143 @@
+-- Schema written by the original (pre-v3) LocalDatabaseManager: decimal
+-- weights and amounts, TEXT bill ids, user_version 0. Used by the
+-- migration tests in test_suite.py.
+
+CREATE TABLE categories (
+    id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+    name TEXT UNIQUE NOT NULL,
+    description TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE suppliers (
+    id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+    name TEXT NOT NULL,
+    code TEXT UNIQUE NOT NULL,
+    contact_person TEXT,
+    phone TEXT,
+    email TEXT,
+    address TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE inventory (
+    id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+    category_id TEXT NOT NULL REFERENCES categories(id),
+    category_item_no INTEGER NOT NULL,
+    description TEXT,
+    hsn_code TEXT,
+    gross_weight DECIMAL(10,3) NOT NULL CHECK (gross_weight > 0),
+    net_weight DECIMAL(10,3) NOT NULL CHECK (net_weight > 0 AND net_weight <= gross_weight),
+    supplier_id TEXT REFERENCES suppliers(id),
+    melting_percentage DECIMAL(5,2) DEFAULT 0.00,
+    status TEXT NOT NULL DEFAULT 'AVAILABLE' CHECK (status IN ('AVAILABLE', 'SOLD', 'RESERVED')),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE hsn_code_history (
+    id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+    hsn_code TEXT UNIQUE NOT NULL,
+    description TEXT,
+    last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE customers (
+    id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+    name TEXT NOT NULL,
+    phone TEXT,
+    email TEXT,
+    address TEXT,
+    gstin TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE bills (
+    id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+    bill_number TEXT UNIQUE NOT NULL,
+    customer_id TEXT REFERENCES customers(id),
+    customer_name TEXT NOT NULL,
+    customer_phone TEXT,
+    customer_gstin TEXT,
+    bill_date DATE NOT NULL DEFAULT (date('now')),
+    subtotal DECIMAL(12,2) NOT NULL DEFAULT 0.00,
+    cgst_rate DECIMAL(5,2) NOT NULL DEFAULT 1.50,
+    sgst_rate DECIMAL(5,2) NOT NULL DEFAULT 1.50,
+    cgst_amount DECIMAL(12,2) NOT NULL DEFAULT 0.00,
+    sgst_amount DECIMAL(12,2) NOT NULL DEFAULT 0.00,
+    total_amount DECIMAL(12,2) NOT NULL DEFAULT 0.00,
+    rounded_off DECIMAL(12,2) NOT NULL DEFAULT 0.00,
+    status TEXT NOT NULL DEFAULT 'GENERATED' CHECK (status IN ('GENERATED', 'REVERSED')),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE bill_items (
+    id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+    bill_id TEXT NOT NULL REFERENCES bills(id) ON DELETE CASCADE,
+    inventory_id TEXT REFERENCES inventory(id),
+    description TEXT NOT NULL,
+    hsn_code TEXT,
+    quantity DECIMAL(10,3) NOT NULL DEFAULT 1.000,
+    rate DECIMAL(12,2) NOT NULL,
+    amount DECIMAL(12,2) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE stock_movements (
+    id TEXT PRIMARY KEY DEFAULT (lower(hex(randomblob(16)))),
+    inventory_id TEXT REFERENCES inventory(id),
+    movement_type TEXT NOT NULL CHECK (movement_type IN ('ADDED', 'SOLD', 'REVERSED', 'ADJUSTED')),
+    reference_id TEXT,
+    reference_type TEXT,
+    quantity DECIMAL(10,3) NOT NULL DEFAULT 1.000,
+    notes TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_inventory_category_status ON inventory(category_id, status);
+
+CREATE INDEX idx_inventory_status ON inventory(status);
+
+CREATE INDEX idx_bill_items_bill_id ON bill_items(bill_id);
+
+CREATE INDEX idx_bill_items_inventory_id ON bill_items(inventory_id);
+
+CREATE INDEX idx_stock_movements_inventory_id ON stock_movements(inventory_id);
+
+CREATE UNIQUE INDEX unique_category_item_no_active
+ON inventory (category_id, category_item_no)
+WHERE status IN ('AVAILABLE', 'RESERVED');
+
+CREATE TRIGGER update_categories_updated_at
+AFTER UPDATE ON categories FOR EACH ROW
+BEGIN
+    UPDATE categories SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER update_suppliers_updated_at
+AFTER UPDATE ON suppliers FOR EACH ROW
+BEGIN
+    UPDATE suppliers SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER update_inventory_updated_at
+AFTER UPDATE ON inventory FOR EACH ROW
+BEGIN
+    UPDATE inventory SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER update_customers_updated_at
+AFTER UPDATE ON customers FOR EACH ROW
+BEGIN
+    UPDATE customers SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER update_bills_updated_at
+AFTER UPDATE ON bills FOR EACH ROW
+BEGIN
+    UPDATE bills SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
@@ -196,6 +196,187 @@ print(f"  Final total: ₹{rounding_totals['final_total']}")
 print(f"\n✅ Rounding behavior test completed")
 print()
 
+# Test 7: Batch PDF Generation
+print("Test 7: Batch Invoice PDFs")
+print("-" * 70)
+
+import tempfile
+from pdf_generator import InvoicePDFGenerator
+
+pdf_gen = InvoicePDFGenerator(os.path.join(parent_dir, "settings.json"))
+batch_invoice = {
+    'invoice_number': 'B001',
+    'invoice_date': '2025-11-02',
+    'customer_name': 'Batch Customer',
+    'subtotal': Decimal('1000.00'),
+    'cgst_amount': Decimal('15.00'),
+    'sgst_amount': Decimal('15.00'),
+    'total_amount': Decimal('1030.00'),
+    'rounded_off': Decimal('0.00'),
+}
+batch_items = [
+    {'description': 'Gold Ring', 'hsn_code': '7113', 'quantity': 10.0, 'rate': 100.0, 'amount': 1000.0}
+]
+
+batch_dir = tempfile.mkdtemp()
+batch_jobs = [
+    (os.path.join(batch_dir, f"invoice_{number}.pdf"), dict(batch_invoice, invoice_number=number), batch_items)
+    for number in ('B001', 'B002', 'B003')
+]
+pdf_gen.generate_invoice_pdfs(batch_jobs)
+for output_path, _, _ in batch_jobs:
+    with open(output_path, 'rb') as f:
+        pdf_bytes = f.read()
+    assert pdf_bytes[:5] == b'%PDF-', f"{output_path} is not a PDF"
+    assert b'ASCII85Decode' not in pdf_bytes, f"{output_path} has ASCII85 streams"
+print(f"Wrote {len(batch_jobs)} invoice PDFs")
+
+# Rendered documents waiting on a write are capped at max_pending_writes
+import threading
+import time
+import pdf_generator
+
+write_file = pdf_generator._write_file
+render = pdf_gen.generate_invoice_pdf
+counts = {'rendered': 0, 'written': 0, 'max_pending': 0}
+counts_lock = threading.Lock()
+
+def slow_write(path, data):
+    time.sleep(0.05)
+    write_file(path, data)
+    with counts_lock:
+        counts['written'] += 1
+
+def counting_render(*args, **kwargs):
+    result = render(*args, **kwargs)
+    with counts_lock:
+        counts['rendered'] += 1
+        counts['max_pending'] = max(counts['max_pending'], counts['rendered'] - counts['written'])
+    return result
+
+pdf_generator._write_file = slow_write
+pdf_gen.generate_invoice_pdf = counting_render
+try:
+    pdf_gen.generate_invoice_pdfs(batch_jobs * 3, max_pending_writes=2)
+finally:
+    pdf_generator._write_file = write_file
+    del pdf_gen.generate_invoice_pdf
+assert counts['written'] == 9, f"Expected 9 writes, got {counts['written']}"
+assert counts['max_pending'] <= 2, f"{counts['max_pending']} documents were pending at once"
+print(f"At most {counts['max_pending']} documents pending with max_pending_writes=2")
+
+# Binary streams are scoped to the generator's saves
+from reportlab import rl_config
+assert rl_config.useA85 == 1, "ReportLab's global useA85 setting was changed"
+
+# A missing output directory must surface as an error
+bad_path = os.path.join(batch_dir, 'missing', 'invoice_B004.pdf')
+try:
+    pdf_gen.generate_invoice_pdfs([(bad_path, batch_invoice, batch_items)])
+except OSError as e:
+    print(f"Bad output path raised: {type(e).__name__}")
+else:
+    raise AssertionError("Expected an error for a missing output directory")
+
+print(f"\n✅ Batch PDF generation test completed")
+print()
+
+# Test 8: Multi-page PDF
+print("Test 8: Invoices Combined into One PDF")
+print("-" * 70)
+
+import re
+
+# Uncompressed, so the page content can be inspected
+multi_gen = InvoicePDFGenerator(os.path.join(parent_dir, "settings.json"), compress=False)
+multi_path = os.path.join(batch_dir, "invoices.pdf")
+multi_gen.generate_invoice_pdf_multi(
+    multi_path, [(invoice_data, batch_items) for _, invoice_data, _ in batch_jobs]
+)
+with open(multi_path, 'rb') as f:
+    multi_pdf = f.read()
+
+page_count = len(re.findall(rb'/Type /Page\b', multi_pdf))
+form_count = multi_pdf.count(b'/Subtype /Form')
+form_uses = len(re.findall(rb'/FormXob\.boilerplate Do', multi_pdf))
+print(f"Pages: {page_count}, boilerplate forms: {form_count}, form uses: {form_uses}")
+assert page_count == len(batch_jobs), f"Expected {len(batch_jobs)} pages, got {page_count}"
+assert form_count == 1, f"Expected one shared boilerplate form, got {form_count}"
+assert form_uses == len(batch_jobs), f"Expected the form on every page, got {form_uses}"
+
+print(f"\n✅ Multi-page PDF test completed")
+print()
+
+# Test 9: Address Wrapping
+print("Test 9: Over-long Text Truncated with an Ellipsis")
+print("-" * 70)
+
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from pdf_generator import _wrap_to_width
+
+long_address = (
+    "Shop No. 12, Shree Ganesh Jewellers Complex, Near Old Clock Tower, "
+    "Main Bazaar Road, Ward 7, Opposite State Bank, Jaipur, Rajasthan 302001, India"
+)
+wrapped = _wrap_to_width(long_address, "Helvetica", 9, 150, 2)
+print(f"Wrapped lines: {wrapped}")
+assert len(wrapped) == 2, f"Expected 2 lines, got {len(wrapped)}"
+assert wrapped[-1].endswith("..."), "Truncated text must end in an ellipsis"
+assert all(stringWidth(line, "Helvetica", 9) <= 150 for line in wrapped), "Line too wide"
+
+# A single word wider than the line is broken between characters
+long_word = _wrap_to_width("X" * 200, "Helvetica", 9, 150, 2)
+assert len(long_word) == 2 and long_word[-1].endswith("..."), f"Got {long_word}"
+assert all(stringWidth(line, "Helvetica", 9) <= 150 for line in long_word), "Line too wide"
+
+# Text that fits is left alone
+assert _wrap_to_width("Jaipur", "Helvetica", 9, 150, 2) == ("Jaipur",)
+
+# On the invoice, an over-long customer address is cut to two lines
+address_pdf = multi_gen.generate_invoice_pdf(
+    None, dict(batch_invoice, customer_address=long_address), batch_items, return_bytes=True
+)
+address_lines = re.findall(rb'\((Shop[^)]*|[^)]*\.\.\.)\) Tj', address_pdf)
+assert len(address_lines) == 2 and address_lines[-1].endswith(b"..."), f"Got {address_lines}"
+assert b"Jaipur" not in address_pdf, "Text past the second line was drawn"
+
+print(f"\n✅ Truncation test completed")
+print()
+
+# Test 10: Items Table Fits the Page
+print("Test 10: Items Table Shrinks Rows to Fit the Page")
+print("-" * 70)
+
+table_gen = InvoicePDFGenerator(os.path.join(parent_dir, "settings.json"))
+draw_table = table_gen._draw_items_table
+tables = []
+
+def recording_draw_table(c, x1, x2, y_start, line_items, invoice_data, bottom_limit):
+    table_end = draw_table(c, x1, x2, y_start, line_items, invoice_data, bottom_limit)
+    tables.append((y_start, bottom_limit, table_end + table_gen.TABLE_GAP))
+    return table_end
+
+table_gen._draw_items_table = recording_draw_table
+table_invoice = dict(batch_invoice, rounded_off=Decimal('0.13'))
+table_gen.generate_invoice_pdf(None, table_invoice, batch_items, return_bytes=True)
+y_start, bottom_limit, _ = tables[-1]
+
+# Header + items + 5 totals rows: more than fit at full height, few enough to
+# fit at the minimum height
+space = y_start - bottom_limit
+item_count = int(space // table_gen.TABLE_MIN_ROW_HEIGHT) - 6
+assert (item_count + 6) * table_gen.TABLE_ROW_HEIGHT > space, "Too few items to shrink the rows"
+table_pdf = table_gen.generate_invoice_pdf(
+    None, table_invoice, batch_items * item_count, return_bytes=True
+)
+_, _, table_bottom = tables[-1]
+print(f"{item_count} items: table spans {y_start:.1f} to {table_bottom:.1f}, limit {bottom_limit:.1f}")
+assert table_bottom >= bottom_limit - 1e-6, "Items table runs past the footer area"
+assert len(re.findall(rb'/Type /Page\b', table_pdf)) == 1, "Items table spilled onto another page"
+
+print(f"\n✅ Items table fit test completed")
+print()
+
 print("=" * 70)
 print("All Advanced Tests Completed Successfully! 🎉")
 print("=" * 70)
@@ -179,7 +179,300 @@ try:
         isinstance(total_summary, dict),
         f"Expected dict, got {type(total_summary)}"
     )
-    
+
+    # Tests that write use a scratch database, never the live one in cwd
+    import tempfile
+    from local_database_manager import LocalDatabaseManager
+    scratch_db = LocalDatabaseManager(os.path.join(tempfile.mkdtemp(), "scratch.db"))
+
+    # Test cached summaries are refreshed after a write
+    scratch_summary = scratch_db.get_category_summary()
+    cache_category_id = scratch_db.add_category("Cache Test Category")
+    refreshed = [c["category_id"] for c in scratch_db.get_category_summary()]
+    scratch_db.delete_category(cache_category_id)
+    test_result(
+        "Category summary refreshed after write",
+        len(refreshed) == len(scratch_summary) + 1 and cache_category_id in refreshed,
+        f"Expected {len(scratch_summary) + 1} categories, got {len(refreshed)}"
+    )
+
+    # Test restoring a backup keeps the manager usable
+    scratch_categories = scratch_db.get_categories()
+    backup_path = os.path.join(tempfile.mkdtemp(), "backup.db")
+    scratch_db.backup_database(backup_path)
+    restore_category_id = scratch_db.add_category("Restore Test Category")
+    scratch_db.restore_database(backup_path)
+    restored = [c["id"] for c in scratch_db.get_categories()]
+    test_result(
+        "Restore database from backup",
+        restore_category_id not in restored and len(restored) == len(scratch_categories),
+        f"Expected {len(scratch_categories)} categories, got {len(restored)}"
+    )
+
+    # Test stock deduction warnings follow the line item order
+    sold_id = scratch_db.add_product(
+        "Ring", gross_weight=5, net_weight=5,
+        category_id=scratch_db.add_category("Warning Test Category")
+    )
+    scratch_db.generate_invoice_with_stock_deduction(
+        {'invoice_number': 'WARN001', 'customer_name': 'Test Customer'},
+        [{'name': 'Ring', 'product_id': sold_id}]
+    )
+    # A is unlinked, B was sold above, C is unlinked
+    _, warnings = scratch_db.generate_invoice_with_stock_deduction(
+        {'invoice_number': 'WARN002', 'customer_name': 'Test Customer'},
+        [{'name': 'A'}, {'name': 'B', 'product_id': sold_id}, {'name': 'C'}]
+    )
+    # Billing a product that no longer exists still saves the invoice
+    missing_bill_id, missing_warnings = scratch_db.generate_invoice_with_stock_deduction(
+        {'invoice_number': 'WARN003', 'customer_name': 'Test Customer'},
+        [{'name': 'Gone', 'product_id': 'deleted-product-id'}]
+    )
+    missing_items = scratch_db.get_invoice_items(missing_bill_id)
+
+    # SQLite before 3.35 has no RETURNING; the fallback must sell the same way
+    import local_database_manager
+    has_returning = local_database_manager._SQLITE_HAS_RETURNING
+    local_database_manager._SQLITE_HAS_RETURNING = False
+    try:
+        fallback_category_id = scratch_db.add_category("Fallback Test Category")
+        fallback_id = scratch_db.add_product(
+            "Ring", gross_weight=5, net_weight=5, quantity=2, category_id=fallback_category_id
+        )
+        _, fallback_warnings = scratch_db.generate_invoice_with_stock_deduction(
+            {'invoice_number': 'WARN004', 'customer_name': 'Test Customer'},
+            [{'name': 'Fallback', 'product_id': fallback_id}, {'name': 'B', 'product_id': sold_id}]
+        )
+    finally:
+        local_database_manager._SQLITE_HAS_RETURNING = has_returning
+    fallback_items = [tuple(r) for r in scratch_db.get_connection().execute(
+        "SELECT id, category_item_no, status FROM inventory WHERE category_id = ? "
+        "ORDER BY category_item_no",
+        (fallback_category_id,)
+    )]
+    scratch_db.close()
+    test_result(
+        "Stock deduction warnings keep line order",
+        [w.split("'")[1] for w in warnings] == ['A', 'B', 'C'],
+        f"Expected warnings for A, B, C in order, got {warnings}"
+    )
+    test_result(
+        "Invoice for a missing product is saved unlinked",
+        missing_warnings == ["Item 'Gone' is not available for sale"]
+        and len(missing_items) == 1 and missing_items[0]['inventory_id'] is None,
+        f"Got warnings {missing_warnings}, items {missing_items}"
+    )
+    test_result(
+        "Add products and deduct stock without RETURNING",
+        [row[1:] for row in fallback_items] == [(1, 'AVAILABLE'), (2, 'SOLD')]
+        and fallback_items[1][0] == fallback_id
+        and fallback_warnings == ["Item 'B' is not available for sale"],
+        f"Got items {fallback_items}, warnings {fallback_warnings}"
+    )
+
+    # Test the category_stats triggers against a direct GROUP BY
+    stats_db = LocalDatabaseManager(os.path.join(tempfile.mkdtemp(), "stats.db"))
+    stats_conn = stats_db.get_connection()
+
+    def category_stats_mismatch():
+        stored = [tuple(r) for r in stats_conn.execute(
+            "SELECT * FROM category_stats ORDER BY category_id"
+        )]
+        expected = [tuple(r) for r in stats_conn.execute(
+            """
+            SELECT
+                c.id,
+                SUM(i.status = 'AVAILABLE'),
+                SUM(i.status = 'SOLD'),
+                SUM(i.status = 'RESERVED'),
+                COUNT(i.id),
+                TOTAL(CASE WHEN i.status = 'AVAILABLE' THEN i.gross_weight_mg END),
+                TOTAL(CASE WHEN i.status = 'AVAILABLE' THEN i.net_weight_mg END),
+                TOTAL(i.gross_weight_mg),
+                TOTAL(i.net_weight_mg)
+            FROM categories c
+            LEFT JOIN inventory i ON c.id = i.category_id
+            GROUP BY c.id
+            ORDER BY c.id
+            """
+        )]
+        # SUM over an empty join is NULL and TOTAL is a float; compare as numbers
+        expected = [(row[0], *(int(v or 0) for v in row[1:])) for row in expected]
+        return None if stored == expected else f"Stored {stored}, expected {expected}"
+
+    stats_a = stats_db.add_category("Stats Category A")
+    stats_b = stats_db.add_category("Stats Category B")
+    mismatch = category_stats_mismatch()
+    test_result("Category stats after adding categories", mismatch is None, mismatch)
+
+    stats_items = [
+        stats_db.add_product("Ring", gross_weight=5.25, net_weight=4.125, category_id=stats_a),
+        stats_db.add_product("Ring", gross_weight=3, net_weight=2.5, category_id=stats_a),
+        stats_db.add_product("Chain", gross_weight=10, net_weight=9.5, category_id=stats_b),
+    ]
+    mismatch = category_stats_mismatch()
+    test_result("Category stats after inserting inventory", mismatch is None, mismatch)
+
+    stats_db.generate_invoice_with_stock_deduction(
+        {'invoice_number': 'STATS001', 'customer_name': 'Test Customer'},
+        [{'name': 'Ring', 'product_id': stats_items[0]}]
+    )
+    with stats_conn:
+        stats_conn.execute(
+            "UPDATE inventory SET status = 'RESERVED' WHERE id = ?", (stats_items[2],)
+        )
+    mismatch = category_stats_mismatch()
+    test_result("Category stats after status changes", mismatch is None, mismatch)
+
+    stats_db.update_product(stats_items[1], category_id=stats_b, gross_weight=3.5)
+    mismatch = category_stats_mismatch()
+    test_result("Category stats after changing category and weight", mismatch is None, mismatch)
+
+    stats_db.delete_product(stats_items[1])
+    mismatch = category_stats_mismatch()
+    test_result("Category stats after deleting inventory", mismatch is None, mismatch)
+
+    stats_c = stats_db.add_category("Stats Category C")
+    stats_db.delete_category(stats_c)
+    stats_row = stats_conn.execute(
+        "SELECT 1 FROM category_stats WHERE category_id = ?", (stats_c,)
+    ).fetchone()
+    mismatch = category_stats_mismatch()
+    test_result(
+        "Category stats after deleting a category",
+        mismatch is None and stats_row is None,
+        mismatch or "Stats row left behind for the deleted category"
+    )
+    stats_db.close()
+
+    # Test the next invoice number uses the latest bill's prefix and its highest number
+    numbering_db = LocalDatabaseManager(os.path.join(tempfile.mkdtemp(), "numbering.db"))
+    first_number = numbering_db.get_next_invoice_number()
+    with numbering_db.get_connection() as numbering_conn:
+        numbering_conn.executemany(
+            "INSERT INTO bills (bill_number, customer_name, created_at) VALUES (?, 'Test', ?)",
+            [
+                ('RK-2024-050', '2024-12-31 10:00:00'),
+                ('RK-2025-002', '2025-01-01 10:00:00'),
+                ('RK-2025-010', '2025-01-02 10:00:00'),
+                ('RK-2025X-999', '2025-01-03 10:00:00'),
+                ('RK-2025-003', '2025-01-04 10:00:00'),
+            ]
+        )
+    next_number = numbering_db.get_next_invoice_number()
+    numbering_db.close()
+    test_result(
+        "Next invoice number follows the latest prefix across gaps",
+        first_number == f"RK-{datetime.now().year}-001" and next_number == "RK-2025-011",
+        f"Expected RK-{datetime.now().year}-001 then RK-2025-011, got {first_number}, {next_number}"
+    )
+
+    # Test item numbers: sequential with no gaps, lowest free slots otherwise
+    slots_db = LocalDatabaseManager(os.path.join(tempfile.mkdtemp(), "slots.db"))
+    slots_category_id = slots_db.add_category("Slots Test Category")
+    slots_conn = slots_db.get_connection()
+
+    def active_item_numbers():
+        return [r[0] for r in slots_conn.execute(
+            "SELECT category_item_no FROM inventory WHERE category_id = ? "
+            "AND status IN ('AVAILABLE', 'RESERVED') ORDER BY category_item_no",
+            (slots_category_id,)
+        )]
+
+    slots_db.add_product(
+        "Ring", gross_weight=2, net_weight=2, quantity=3, category_id=slots_category_id
+    )
+    sequential_numbers = active_item_numbers()
+    middle_id = slots_conn.execute(
+        "SELECT id FROM inventory WHERE category_id = ? AND category_item_no = 2",
+        (slots_category_id,)
+    ).fetchone()[0]
+    slots_db.delete_product(middle_id)
+    slots_db.add_product(
+        "Ring", gross_weight=2, net_weight=2, quantity=2, category_id=slots_category_id
+    )
+    reused_numbers = active_item_numbers()
+
+    # Test a sold item can't be deleted, and its stock history stays
+    sold_slot_id = slots_conn.execute(
+        "SELECT id FROM inventory WHERE category_id = ? AND category_item_no = 1",
+        (slots_category_id,)
+    ).fetchone()[0]
+    slots_db.generate_invoice_with_stock_deduction(
+        {'invoice_number': 'SLOT001', 'customer_name': 'Test Customer'},
+        [{'name': 'Ring', 'product_id': sold_slot_id}]
+    )
+    try:
+        slots_db.delete_product(sold_slot_id)
+        delete_error = None
+    except ValueError as e:
+        delete_error = str(e)
+    sold_slot_left = slots_conn.execute(
+        "SELECT (SELECT COUNT(*) FROM inventory WHERE id = ?), "
+        "(SELECT COUNT(*) FROM stock_movements WHERE inventory_id = ?)",
+        (sold_slot_id, sold_slot_id)
+    ).fetchone()
+    slots_db.close()
+    test_result(
+        "New items are numbered sequentially",
+        sequential_numbers == [1, 2, 3],
+        f"Expected [1, 2, 3], got {sequential_numbers}"
+    )
+    test_result(
+        "New items reuse a deleted item's number first",
+        reused_numbers == [1, 2, 3, 4],
+        f"Expected [1, 2, 3, 4], got {reused_numbers}"
+    )
+    test_result(
+        "Deleting a sold item is refused",
+        delete_error == "Cannot delete sold inventory item" and tuple(sold_slot_left) == (1, 2),
+        f"Got error {delete_error!r}, item/movement counts {tuple(sold_slot_left)}"
+    )
+
+    # Test an invoice with more distinct items than one IN (...) chunk holds
+    from local_database_manager import MAX_SQL_PARAMS
+    bulk_db = LocalDatabaseManager(os.path.join(tempfile.mkdtemp(), "bulk.db"))
+    bulk_category_id = bulk_db.add_category("Bulk Test Category")
+    bulk_db.add_product(
+        "Ring", gross_weight=1, net_weight=1, quantity=MAX_SQL_PARAMS + 10,
+        category_id=bulk_category_id
+    )
+    bulk_conn = bulk_db.get_connection()
+    bulk_ids = [r[0] for r in bulk_conn.execute(
+        "SELECT id FROM inventory WHERE category_id = ? ORDER BY category_item_no",
+        (bulk_category_id,)
+    )]
+    bulk_bill_id, bulk_warnings = bulk_db.generate_invoice_with_stock_deduction(
+        {'invoice_number': 'BULK001', 'customer_name': 'Test Customer'},
+        [{'name': f'Ring {n}', 'product_id': product_id} for n, product_id in enumerate(bulk_ids)]
+    )
+    bulk_sold = bulk_conn.execute(
+        "SELECT COUNT(*) FROM inventory WHERE category_id = ? AND status = 'SOLD'",
+        (bulk_category_id,)
+    ).fetchone()[0]
+    bulk_linked = bulk_conn.execute(
+        "SELECT COUNT(inventory_id) FROM bill_items WHERE bill_id = ?", (bulk_bill_id,)
+    ).fetchone()[0]
+    bulk_db.close()
+    test_result(
+        f"Invoice with {len(bulk_ids)} items sells across the {MAX_SQL_PARAMS}-id chunks",
+        bulk_warnings == [] and bulk_sold == len(bulk_ids) and bulk_linked == len(bulk_ids),
+        f"Sold {bulk_sold}, linked {bulk_linked} of {len(bulk_ids)}, warnings {bulk_warnings[:3]}"
+    )
+
+    # Test integer storage unit conversion (grams -> mg, rupees -> paise)
+    from local_database_manager import _to_mg, _to_paise
+    test_result(
+        "Convert weight to milligrams",
+        _to_mg('5.250') == 5250 and _to_mg(0.1) == 100,
+        f"Expected 5250/100, got {_to_mg('5.250')}/{_to_mg(0.1)}"
+    )
+    test_result(
+        "Convert amount to paise",
+        _to_paise('1030.13') == 103013 and _to_paise(-0.13) == -13,
+        f"Expected 103013/-13, got {_to_paise('1030.13')}/{_to_paise(-0.13)}"
+    )
+
 except Exception as e:
     test_result("Database operations", False, str(e))
 
@@ -321,6 +614,186 @@ except Exception as e:
 
 print()
 
+# Test 7: Database Migrations
+print("Test Suite 7: Database Migrations")
+print("-" * 70)
+
+try:
+    import sqlite3
+    import tempfile
+    from local_database_manager import LocalDatabaseManager, SCHEMA_VERSION
+
+    # Build a database the way the original (pre-v3) schema stored it
+    legacy_path = os.path.join(tempfile.mkdtemp(), "legacy.db")
+    legacy = sqlite3.connect(legacy_path)
+    with open(os.path.join(os.path.dirname(__file__), "legacy_schema.sql")) as f:
+        legacy.executescript(f.read())
+    legacy.executescript("""
+        INSERT INTO categories (id, name) VALUES ('cat-ring', 'Ring');
+        INSERT INTO suppliers (id, name, code) VALUES ('sup-1', 'Supplier', 'SUP1');
+        INSERT INTO inventory (id, category_id, category_item_no, gross_weight, net_weight,
+                               supplier_id, status)
+        VALUES ('inv-1', 'cat-ring', 1, 5.25, 4.125, 'sup-1', 'SOLD'),
+               ('inv-2', 'cat-ring', 2, 10.5, 9.999, 'sup-1', 'AVAILABLE');
+        INSERT INTO bills (id, bill_number, customer_name, subtotal, cgst_amount,
+                           sgst_amount, total_amount, rounded_off, created_at)
+        VALUES ('bill-b', 'RK1002', 'Second Customer', 200.00, 3.00, 3.00, 206.00, 0.00,
+                '2025-01-02 10:00:00'),
+               ('bill-a', 'RK1001', 'First Customer', 1000.13, 15.00, 15.00, 1030.00, -0.13,
+                '2025-01-01 10:00:00');
+        INSERT INTO bill_items (id, bill_id, inventory_id, description, quantity, rate, amount)
+        VALUES ('item-1', 'bill-a', 'inv-1', 'Ring', 4.125, 242.46, 1000.13),
+               ('item-2', 'bill-b', NULL, 'Making charges', 1, 200.00, 200.00);
+        INSERT INTO stock_movements (id, inventory_id, movement_type, reference_id,
+                                     reference_type)
+        VALUES ('move-1', 'inv-1', 'ADDED', NULL, NULL),
+               ('move-2', 'inv-1', 'SOLD', 'bill-a', 'BILL');
+    """)
+    legacy.close()
+
+    migrated_db = LocalDatabaseManager(legacy_path)
+    conn = migrated_db.get_connection()
+
+    user_version = conn.execute("PRAGMA user_version").fetchone()[0]
+    test_result(
+        "Legacy database migrated to current schema version",
+        user_version == SCHEMA_VERSION,
+        f"Expected user_version {SCHEMA_VERSION}, got {user_version}"
+    )
+
+    weights = [tuple(r) for r in conn.execute(
+        "SELECT id, gross_weight_mg, net_weight_mg FROM inventory ORDER BY id"
+    )]
+    test_result(
+        "Legacy weights converted to milligrams",
+        weights == [('inv-1', 5250, 4125), ('inv-2', 10500, 9999)],
+        f"Got {weights}"
+    )
+
+    amounts = [tuple(r) for r in conn.execute(
+        """
+        SELECT bill_number, subtotal_paise, cgst_amount_paise, total_amount_paise,
+               rounded_off_paise
+        FROM bills ORDER BY bill_number
+        """
+    )]
+    test_result(
+        "Legacy bill amounts converted to paise",
+        amounts == [('RK1001', 100013, 1500, 103000, -13), ('RK1002', 20000, 300, 20600, 0)],
+        f"Got {amounts}"
+    )
+
+    items = [tuple(r) for r in conn.execute(
+        """
+        SELECT b.bill_number, bi.quantity_mg, bi.rate_paise, bi.amount_paise
+        FROM bill_items bi JOIN bills b ON b.id = bi.bill_id ORDER BY b.bill_number
+        """
+    )]
+    test_result(
+        "Legacy bill items converted to integer units",
+        items == [('RK1001', 4125, 24246, 100013), ('RK1002', 1000, 20000, 20000)],
+        f"Got {items}"
+    )
+
+    invoices = {i['bill_number']: i for i in migrated_db.get_invoices()}
+    test_result(
+        "Migrated invoices read back in rupees",
+        invoices['RK1001']['total_amount'] == 1030.0
+        and invoices['RK1001']['rounded_off'] == -0.13,
+        f"Got {invoices.get('RK1001')}"
+    )
+
+    # TEXT bill ids are renumbered in creation order and references follow
+    bill_ids = [tuple(r) for r in conn.execute(
+        "SELECT id, bill_number, typeof(id) FROM bills ORDER BY id"
+    )]
+    test_result(
+        "Legacy bill ids rebuilt as integers",
+        bill_ids == [(1, 'RK1001', 'integer'), (2, 'RK1002', 'integer')],
+        f"Got {bill_ids}"
+    )
+
+    item_bill_ids = [tuple(r) for r in conn.execute(
+        "SELECT description, bill_id, typeof(bill_id) FROM bill_items ORDER BY bill_id"
+    )]
+    test_result(
+        "Bill items point at the new bill ids",
+        item_bill_ids == [('Ring', 1, 'integer'), ('Making charges', 2, 'integer')],
+        f"Got {item_bill_ids}"
+    )
+    test_result(
+        "Migrated invoice items load by new bill id",
+        [i['description'] for i in migrated_db.get_invoice_items(1)] == ['Ring'],
+        f"Got {migrated_db.get_invoice_items(1)}"
+    )
+
+    references = [tuple(r) for r in conn.execute(
+        "SELECT movement_type, reference_type, reference_id FROM stock_movements ORDER BY id"
+    )]
+    test_result(
+        "Stock movements reference the new bill ids",
+        references == [('ADDED', None, None), ('SOLD', 'BILL', '1')],
+        f"Got {references}"
+    )
+
+    fk_violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+    test_result(
+        "Migrated database has no foreign key violations",
+        fk_violations == [],
+        f"Got {[tuple(r) for r in fk_violations]}"
+    )
+
+    migrated_db.close()
+
+    # A failed migration leaves the database as it was and is retried
+    failing_path = os.path.join(tempfile.mkdtemp(), "failing.db")
+    failing = sqlite3.connect(failing_path)
+    with open(os.path.join(os.path.dirname(__file__), "legacy_schema.sql")) as f:
+        failing.executescript(f.read())
+    # Rounds to 0 mg, which the integer schema's CHECK rejects
+    failing.executescript("""
+        INSERT INTO categories (id, name) VALUES ('cat-ring', 'Ring');
+        INSERT INTO inventory (id, category_id, category_item_no, gross_weight, net_weight)
+        VALUES ('inv-1', 'cat-ring', 1, 0.0004, 0.0004);
+    """)
+    failing.close()
+
+    try:
+        LocalDatabaseManager(failing_path).close()
+        migration_raised = False
+    except Exception:
+        migration_raised = True
+    failing = sqlite3.connect(failing_path)
+    failed_version = failing.execute("PRAGMA user_version").fetchone()[0]
+    failed_columns = [col[1] for col in failing.execute("PRAGMA table_info(inventory)")]
+    test_result(
+        "Failed migration raises and leaves user_version unstamped",
+        migration_raised and failed_version == 0 and "gross_weight" in failed_columns,
+        f"Raised {migration_raised}, user_version {failed_version}, columns {failed_columns}"
+    )
+
+    with failing:
+        failing.execute("UPDATE inventory SET gross_weight = 1.5, net_weight = 1.25")
+    failing.close()
+    retried_db = LocalDatabaseManager(failing_path)
+    retried = retried_db.get_connection().execute(
+        "SELECT gross_weight_mg, net_weight_mg FROM inventory"
+    ).fetchall()
+    retried_version = retried_db.get_connection().execute(
+        "PRAGMA user_version"
+    ).fetchone()[0]
+    retried_db.close()
+    test_result(
+        "Failed migration is retried on the next open",
+        [tuple(r) for r in retried] == [(1500, 1250)] and retried_version == SCHEMA_VERSION,
+        f"Got {[tuple(r) for r in retried]}, user_version {retried_version}"
+    )
+
+except Exception as e:
+    test_result("Database migrations", False, str(e))
+
+print()
+
 # Test 8: Folder Structure
 print("Test Suite 8: Folder Structure")
 print("-" * 70)
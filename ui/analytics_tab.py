@@ -29,11 +29,29 @@ from PyQt5.QtCore import Qt, QDate, pyqtSignal, QThread
 from PyQt5.QtGui import QFont
 from datetime import datetime, timedelta
 import csv
-from typing import Dict, List
+import os
+from typing import Dict, List, Tuple
 
 from logic.database_manager import UnifiedDatabaseManager
 
 
+def _invoice_document(invoice: Dict, items: List[Dict]) -> Tuple[Dict, List[Dict]]:
+    """Map a stored bill and its items onto the PDF generator's inputs."""
+    invoice_data = {
+        "invoice_number": invoice.get("bill_number", ""),
+        "invoice_date": invoice.get("bill_date", ""),
+        "customer_name": invoice.get("customer_name") or "",
+        "customer_phone": invoice.get("customer_phone") or "",
+        "customer_gstin": invoice.get("customer_gstin") or "",
+        "subtotal": invoice.get("subtotal", 0),
+        "cgst_amount": invoice.get("cgst_amount", 0),
+        "sgst_amount": invoice.get("sgst_amount", 0),
+        "total_amount": invoice.get("total_amount", 0),
+        "rounded_off": invoice.get("rounded_off") or 0,
+    }
+    return invoice_data, items
+
+
 class AnalyticsTab(QWidget):
     """Analytics and reporting tab widget."""
 
@@ -42,11 +60,24 @@ class AnalyticsTab(QWidget):
 
         self.db = db
         self.settings = settings
+        self._pdf_generator = None
+
+        # (invoice, items) pairs shown in the recent invoices table
+        self.recent_invoices: List[Tuple[Dict, List[Dict]]] = []
 
         # Setup UI
         self.init_ui()
         self.load_data()
 
+    @property
+    def pdf_generator(self):
+        """Invoice PDF generator, created on first use (keeps ReportLab off startup)."""
+        if self._pdf_generator is None:
+            from logic.pdf_generator import InvoicePDFGenerator
+
+            self._pdf_generator = InvoicePDFGenerator("settings.json")
+        return self._pdf_generator
+
     def init_ui(self):
         """Initialize the analytics UI."""
         layout = QVBoxLayout(self)
@@ -149,6 +180,17 @@ class AnalyticsTab(QWidget):
         self.invoices_table.setAlternatingRowColors(True)
         invoices_layout.addWidget(self.invoices_table)
 
+        # Invoice PDF actions
+        invoice_buttons_layout = QHBoxLayout()
+        print_invoices_btn = QPushButton("🖨️ Print Invoices")
+        print_invoices_btn.clicked.connect(self.print_invoices)
+        invoice_buttons_layout.addWidget(print_invoices_btn)
+        export_pdfs_btn = QPushButton("📄 Export Invoice PDFs")
+        export_pdfs_btn.clicked.connect(self.export_invoice_pdfs)
+        invoice_buttons_layout.addWidget(export_pdfs_btn)
+        invoice_buttons_layout.addStretch()
+        invoices_layout.addLayout(invoice_buttons_layout)
+
         layout.addWidget(invoices_group)
 
         # Top selling items table
@@ -375,6 +417,7 @@ class AnalyticsTab(QWidget):
             # Load recent invoices
             invoices = self.db.get_invoices(50)
             self.invoices_table.setRowCount(len(invoices))
+            self.recent_invoices = []
 
             for row, invoice in enumerate(invoices):
                 # Use the correct field name from database
@@ -394,6 +437,7 @@ class AnalyticsTab(QWidget):
                 # Get item count for this invoice
                 items = self.db.get_invoice_items(invoice["id"])
                 self.invoices_table.setItem(row, 3, QTableWidgetItem(str(len(items))))
+                self.recent_invoices.append((invoice, items))
 
                 self.invoices_table.setItem(
                     row, 4, QTableWidgetItem(f"₹{invoice['total_amount']:,.2f}")
@@ -419,6 +463,69 @@ class AnalyticsTab(QWidget):
         except Exception as e:
             QMessageBox.warning(self, "Warning", f"Error loading sales data: {str(e)}")
 
+    def print_invoices(self):
+        """Save the recent invoices as one PDF, a page per invoice, for printing."""
+        if not self.recent_invoices:
+            QMessageBox.information(self, "Print Invoices", "No invoices to print.")
+            return
+
+        try:
+            filename, _ = QFileDialog.getSaveFileName(
+                self,
+                "Save Invoices for Printing",
+                f"invoices_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+                "PDF Files (*.pdf)",
+            )
+
+            if filename:
+                self.pdf_generator.generate_invoice_pdf_multi(
+                    filename,
+                    [
+                        _invoice_document(invoice, items)
+                        for invoice, items in self.recent_invoices
+                    ],
+                )
+                QMessageBox.information(
+                    self,
+                    "Success",
+                    f"{len(self.recent_invoices)} invoices saved to {filename}",
+                )
+
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error printing invoices: {str(e)}")
+
+    def export_invoice_pdfs(self):
+        """Save each recent invoice as its own PDF in a chosen folder."""
+        if not self.recent_invoices:
+            QMessageBox.information(
+                self, "Export Invoice PDFs", "No invoices to export."
+            )
+            return
+
+        try:
+            directory = QFileDialog.getExistingDirectory(
+                self, "Select Export Directory"
+            )
+
+            if directory:
+                jobs = []
+                for invoice, items in self.recent_invoices:
+                    invoice_data, line_items = _invoice_document(invoice, items)
+                    output_path = os.path.join(
+                        directory, f"invoice_{invoice_data['invoice_number']}.pdf"
+                    )
+                    jobs.append((output_path, invoice_data, line_items))
+
+                self.pdf_generator.generate_invoice_pdfs(jobs)
+                QMessageBox.information(
+                    self, "Success", f"{len(jobs)} invoices saved to {directory}"
+                )
+
+        except Exception as e:
+            QMessageBox.critical(
+                self, "Error", f"Error exporting invoice PDFs: {str(e)}"
+            )
+
     def load_inventory_data(self):
         """Load inventory analytics data."""
         try:
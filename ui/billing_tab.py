@@ -43,7 +43,6 @@ from pathlib import Path
 
 from logic.database_manager import UnifiedDatabaseManager
 from logic.calculator import create_calculator, CalculationError
-from logic.pdf_generator import InvoicePDFGenerator
 from ui.keyboard_navigation import (
     KeyboardNavigationMixin,
     ConfirmationDialog,
@@ -63,7 +62,7 @@ class BillingTab(QWidget, KeyboardNavigationMixin):
         self.db = db
         self.calculator = calculator
         self.settings = settings
-        self.pdf_generator = InvoicePDFGenerator("settings.json")
+        self._pdf_generator = None  # Created on first use, see pdf_generator
 
         # Post-generation state
         self.last_pdf_path: Optional[str] = None
@@ -82,6 +81,19 @@ class BillingTab(QWidget, KeyboardNavigationMixin):
         self.setup_keyboard_navigation()
         self.load_data()
 
+    @property
+    def pdf_generator(self):
+        """Invoice PDF generator, created on first use.
+
+        ReportLab is imported only when the first invoice is rendered, which
+        keeps it off the application's startup path.
+        """
+        if self._pdf_generator is None:
+            from logic.pdf_generator import InvoicePDFGenerator
+
+            self._pdf_generator = InvoicePDFGenerator("settings.json")
+        return self._pdf_generator
+
     def init_ui(self):
         """Initialize the billing UI with a scrollable page."""
         # Outer layout contains a single scroll area so the whole page can scroll
@@ -1113,32 +1125,26 @@ class BillingTab(QWidget, KeyboardNavigationMixin):
             if self.override_total_spin.value() > 0:
                 self.apply_override_allocation()
 
-            # Calculate totals
-            totals = self.calculator.calculate_invoice_totals(self.line_items)
-
-            # Check if total is overridden
-            final_total = float(totals["final_total"])
+            # Calculate totals (an overridden total sets the rounding)
+            user_total = None
             if self.override_total_spin.value() > 0:
-                final_total = self.override_total_spin.value()
-                # Recalculate rounding for override total
-                totals["rounded_off"] = final_total - (
-                    float(totals["subtotal"])
-                    + float(totals["cgst"])
-                    + float(totals["sgst"])
-                )
+                user_total = Decimal(str(self.override_total_spin.value()))
+            totals = self.calculator.calculate_invoice_totals(
+                self.line_items, user_total_inclusive=user_total
+            )
 
-            # Prepare invoice data
+            # Prepare invoice data (amounts stay Decimal, as calculated)
             invoice_data = {
                 "invoice_number": self.invoice_number_edit.text(),
                 "customer_name": self.customer_name_edit.text().strip(),
                 "customer_phone": self.customer_phone_edit.text().strip(),
                 "customer_gstin": self.customer_gstin_edit.text().strip(),
                 "invoice_date": self.invoice_date_edit.date().toString("yyyy-MM-dd"),
-                "subtotal": float(totals["subtotal"]),
-                "cgst_amount": float(totals["cgst"]),
-                "sgst_amount": float(totals["sgst"]),
-                "total_amount": final_total,
-                "rounded_off": float(totals["rounded_off"]),
+                "subtotal": totals["subtotal"],
+                "cgst_amount": totals["cgst"],
+                "sgst_amount": totals["sgst"],
+                "total_amount": totals["final_total"],
+                "rounded_off": totals["rounded_off"],
             }
 
             # Prepare output path first (before any database operations)
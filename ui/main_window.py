@@ -160,6 +160,7 @@ class UnifiedJewelryApp(QMainWindow):
         # Settings tab
         self.settings_tab = SettingsTab(self.db, self.settings)
         self.settings_tab.settings_updated.connect(self.on_settings_updated)
+        self.settings_tab.database_restored.connect(self.on_database_restored)
         self.tab_widget.addTab(self.settings_tab, "⚙️ Settings")
 
         # Connect tab change signal to refresh billing when switched to
@@ -303,6 +304,13 @@ class UnifiedJewelryApp(QMainWindow):
         self.status_label.setText("Stock updated successfully!")
         self.billing_tab.refresh_products()
 
+    def on_database_restored(self):
+        """Handle database restored signal."""
+        self.status_label.setText("Database restored successfully!")
+        self.billing_tab.refresh_products()
+        self.stock_tab.load_data()
+        self.analytics_tab.refresh_data()
+
     def on_tab_changed(self, index):
         """Handle tab change - refresh billing tab when switched to it."""
         if index == 0:  # Billing tab index
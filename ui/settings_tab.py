@@ -38,6 +38,7 @@ class SettingsTab(QWidget):
 
     # Signals
     settings_updated = pyqtSignal(dict)
+    database_restored = pyqtSignal()
 
     def __init__(
         self,
@@ -356,12 +357,12 @@ class SettingsTab(QWidget):
         info_layout.addWidget(self.db_type_label, 0, 1)
 
         info_layout.addWidget(QLabel("Database File:"), 1, 0)
-        self.db_file_label = QLabel(self.db.db_path)
+        self.db_file_label = QLabel(self.db.get_db_info())
         info_layout.addWidget(self.db_file_label, 1, 1, 1, 3)
 
         # Database stats
         try:
-            with self.db.get_connection() as conn:
+            with self.db.read_connection() as conn:
                 cursor = conn.cursor()
 
                 # Get table counts
@@ -722,9 +723,7 @@ class SettingsTab(QWidget):
             )
 
             if filename:
-                import shutil
-
-                shutil.copy2(self.db.db_path, filename)
+                self.db.backup_database(filename)
                 QMessageBox.information(
                     self, "Success", f"Database backed up to {filename}"
                 )
@@ -748,18 +747,12 @@ class SettingsTab(QWidget):
                 )
 
                 if filename:
-                    import shutil
-
-                    # Close current database connection
-                    # self.db.close()  # Implement if needed
-
-                    # Replace database file
-                    shutil.copy2(filename, self.db.db_path)
+                    # Copied into the open database, so every tab keeps working
+                    self.db.restore_database(filename)
+                    self.database_restored.emit()
 
                     QMessageBox.information(
-                        self,
-                        "Success",
-                        "Database restored successfully!\nPlease restart the application.",
+                        self, "Success", "Database restored successfully!"
                     )
 
             except Exception as e:
@@ -947,35 +940,15 @@ class SettingsTab(QWidget):
                 )
 
                 if ok and text == "DELETE ALL":
-                    try:
-                        with self.db.get_connection() as conn:
-                            cursor = conn.cursor()
-
-                            # Clear all tables in correct order (SQLite schema)
-                            tables = [
-                                "stock_movements",
-                                "bill_items",
-                                "bills",
-                                "inventory",
-                                "customers",
-                                "suppliers",
-                                "categories",
-                            ]
-
-                            for table in tables:
-                                cursor.execute(f"DELETE FROM {table}")
-
-                            conn.commit()
-
+                    if self.db.clear_all_data():
                         QMessageBox.information(
                             self,
                             "Data Cleared",
                             "All data has been permanently deleted from the database.",
                         )
-
-                    except Exception as e:
+                    else:
                         QMessageBox.critical(
-                            self, "Error", f"Error clearing data: {str(e)}"
+                            self, "Error", "Error clearing data. No data was deleted."
                         )
                 else:
                     QMessageBox.information(
@@ -43,7 +43,6 @@ from datetime import datetime
 from typing import List, Dict, Optional
 
 from logic.database_manager import SupabaseDatabaseManager as UnifiedDatabaseManager
-from logic.label_printer import LabelPrinter
 from ui.keyboard_navigation import (
     KeyboardNavigationMixin,
     ConfirmationDialog,
@@ -69,14 +68,27 @@ class StockTab(QWidget, KeyboardNavigationMixin):
         self.categories = []
         self.suppliers = []
 
-        # Initialize label printer
-        self.label_printer = LabelPrinter()
+        # Label printer is created on first use, see label_printer
+        self._label_printer = None
 
         # Setup UI
         self.init_ui()
         self.setup_keyboard_navigation()
         self.load_data()
 
+    @property
+    def label_printer(self):
+        """Label printer, created on first use.
+
+        ReportLab is imported only when the first label is printed, which
+        keeps it off the application's startup path.
+        """
+        if self._label_printer is None:
+            from logic.label_printer import LabelPrinter
+
+            self._label_printer = LabelPrinter()
+        return self._label_printer
+
     def init_ui(self):
         """Initialize the stock management UI."""
         layout = QVBoxLayout(self)